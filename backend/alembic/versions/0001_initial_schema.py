@@ -0,0 +1,106 @@
+"""Initial schema: profiles, resumes, chat_conversations, resume_versions
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-08-30
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'profiles',
+        sa.Column('id', sa.String(), primary_key=True, index=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False, unique=True, index=True),
+        sa.Column('phone', sa.String(), nullable=False),
+        sa.Column('location', sa.String(), nullable=False),
+        sa.Column('linkedin', sa.String(), nullable=True),
+        sa.Column('website', sa.String(), nullable=True),
+        sa.Column('avatar', sa.String(), nullable=True),
+        sa.Column('bio', sa.Text(), nullable=True),
+        sa.Column('theme', sa.String(), server_default='light'),
+        sa.Column('notifications', sa.Boolean(), server_default=sa.text('true')),
+        sa.Column('auto_save', sa.Boolean(), server_default=sa.text('true')),
+        sa.Column('subscription_plan', sa.String(), server_default='free'),
+        sa.Column('subscription_expires_at', sa.DateTime(), nullable=True),
+        sa.Column('resumes_created', sa.Integer(), server_default='0'),
+        sa.Column('profile_views', sa.Integer(), server_default='0'),
+        sa.Column('downloads_this_month', sa.Integer(), server_default='0'),
+        sa.Column('last_active', sa.DateTime(), server_default=sa.func.now()),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now()),
+    )
+
+    op.create_table(
+        'resumes',
+        sa.Column('id', sa.String(), primary_key=True, index=True),
+        sa.Column('profile_id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('phone', sa.String(), nullable=False),
+        sa.Column('location', sa.String(), nullable=False),
+        sa.Column('linkedin', sa.String(), nullable=True),
+        sa.Column('website', sa.String(), nullable=True),
+        sa.Column('summary', sa.Text(), nullable=True),
+        sa.Column('experience', sa.Text(), nullable=True),
+        sa.Column('skills', sa.Text(), nullable=True),
+        sa.Column('education', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now()),
+    )
+
+    op.create_table(
+        'chat_conversations',
+        sa.Column('id', UUID(as_uuid=True), primary_key=True, index=True,
+                  server_default=sa.text('gen_random_uuid()')),
+        sa.Column('user_id', sa.String(), nullable=False, index=True),
+        sa.Column('session_id', sa.String(), nullable=False, index=True),
+        sa.Column('message_type', sa.String(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('message_metadata', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), index=True),
+    )
+    op.create_index(
+        'idx_chat_user_session_created',
+        'chat_conversations',
+        ['user_id', 'session_id', sa.text('created_at DESC')],
+    )
+    op.create_index(
+        'idx_chat_user_created',
+        'chat_conversations',
+        ['user_id', sa.text('created_at DESC')],
+    )
+
+    op.create_table(
+        'resume_versions',
+        sa.Column('id', UUID(as_uuid=True), primary_key=True, index=True,
+                  server_default=sa.text('gen_random_uuid()')),
+        sa.Column('user_id', sa.String(), nullable=False, index=True),
+        sa.Column('resume_id', sa.String(), nullable=False, index=True),
+        sa.Column('version_number', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('changes_summary', sa.Text(), nullable=True),
+        sa.Column('created_by', sa.String(), server_default='user'),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('resume_versions')
+    op.drop_index('idx_chat_user_created', table_name='chat_conversations')
+    op.drop_index('idx_chat_user_session_created', table_name='chat_conversations')
+    op.drop_table('chat_conversations')
+    op.drop_table('resumes')
+    op.drop_table('profiles')
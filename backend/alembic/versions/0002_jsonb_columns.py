@@ -0,0 +1,39 @@
+"""Convert JSON-as-TEXT columns to native jsonb
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-08-30
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+JSONB_COLUMNS = (
+    ('resumes', 'experience'),
+    ('resumes', 'skills'),
+    ('resumes', 'education'),
+    ('chat_conversations', 'message_metadata'),
+    ('resume_versions', 'content'),
+)
+
+
+def upgrade() -> None:
+    for table, column in JSONB_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=JSONB,
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    for table, column in JSONB_COLUMNS:
+        op.alter_column(table, column, type_=sa.Text())
@@ -0,0 +1,35 @@
+"""Partial indexes for change-tracking queries on chat_conversations
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-08-30
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_chat_ct_user_created',
+        'chat_conversations',
+        ['user_id', sa.text('created_at DESC')],
+        postgresql_where=sa.text("message_type = 'change_tracking'"),
+    )
+    op.create_index(
+        'idx_chat_ct_id',
+        'chat_conversations',
+        ['id'],
+        postgresql_where=sa.text("message_type = 'change_tracking'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_chat_ct_id', table_name='chat_conversations')
+    op.drop_index('idx_chat_ct_user_created', table_name='chat_conversations')
@@ -0,0 +1,27 @@
+"""Composite index for latest-resume lookups on resumes
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-08-30
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_resume_profile_updated',
+        'resumes',
+        ['profile_id', sa.text('updated_at DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_resume_profile_updated', table_name='resumes')
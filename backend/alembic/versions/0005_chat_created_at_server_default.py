@@ -0,0 +1,31 @@
+"""Server-side default for chat_conversations.created_at
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-08-30
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'chat_conversations',
+        'created_at',
+        server_default=sa.func.now(),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'chat_conversations',
+        'created_at',
+        server_default=None,
+    )
@@ -0,0 +1,32 @@
+"""Hot-path JSONB session blob table for chat context reads
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-08-30
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'chat_sessions',
+        sa.Column('session_id', sa.String(), primary_key=True),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('messages', JSONB(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_chat_sessions_user_id', 'chat_sessions', ['user_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chat_sessions_user_id', table_name='chat_sessions')
+    op.drop_table('chat_sessions')
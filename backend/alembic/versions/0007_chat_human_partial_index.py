@@ -0,0 +1,28 @@
+"""Partial index on human chat messages for first-message lookups
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-08-30
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_chat_user_session_human',
+        'chat_conversations',
+        ['user_id', 'session_id', 'created_at'],
+        postgresql_where=sa.text("message_type = 'human'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_chat_user_session_human', table_name='chat_conversations')
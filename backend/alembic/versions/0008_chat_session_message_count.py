@@ -0,0 +1,30 @@
+"""Lifetime message counter on the session blob table
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-08-30
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'chat_sessions',
+        sa.Column('message_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+    # Existing blobs have never been trimmed, so their length is the total
+    op.execute(
+        "UPDATE chat_sessions SET message_count = jsonb_array_length(messages)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('chat_sessions', 'message_count')
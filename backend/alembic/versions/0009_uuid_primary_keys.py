@@ -0,0 +1,44 @@
+"""Convert legacy varchar primary keys to native uuid
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2025-08-30
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+# Databases provisioned by the retired boot-time create_all have VARCHAR
+# ids holding uuid4 hex strings; revision 0001 declares these columns as
+# native uuid, so stamped deploys never ran the conversion the old
+# migrate_uuid_primary_keys() script performed. The guard makes this a
+# no-op on schemas where the column is already uuid.
+UUID_ID_TABLES = ('chat_conversations', 'resume_versions')
+
+
+def upgrade() -> None:
+    for table in UUID_ID_TABLES:
+        op.execute(f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = '{table}'
+                  AND column_name = 'id'
+                  AND data_type = 'character varying'
+            ) THEN
+                ALTER TABLE {table} ALTER COLUMN id TYPE uuid USING id::uuid;
+                ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid();
+            END IF;
+        END $$;
+        """)
+
+
+def downgrade() -> None:
+    # The uuid columns stay valid on older code paths; nothing to revert
+    pass
@@ -1,18 +1,96 @@
+import orjson
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 import uuid
 from datetime import datetime
 
 from ..database.connection import get_db
 from ..database.models import ProfileTable
 from ..models.profile import ProfileData, ProfileDataCreate, ProfileDataUpdate, ProfilePreferences, ProfileSubscription, ProfileStats
+from ..services.profile_activity import profile_activity
 
 router = APIRouter()
 
+# Per-process read cache for hot profiles. Entries live a few seconds, which
+# is enough to collapse concurrent reads of the same row without letting
+# writes go stale for long; write endpoints invalidate explicitly.
+_profile_cache: TTLCache = TTLCache(maxsize=10_000, ttl=5)
+
+# One serializer built once at import time; dump_json goes straight through
+# pydantic-core instead of rebuilding schema machinery per response
+_PROFILE_ADAPTER: TypeAdapter = TypeAdapter(ProfileData)
+
+# Column tuple for Core reads: fetching plain row tuples skips the ORM
+# identity map and the per-attribute descriptor dispatch of entity access
+_PROFILE_COLUMNS = (
+    ProfileTable.id,
+    ProfileTable.name,
+    ProfileTable.title,
+    ProfileTable.email,
+    ProfileTable.phone,
+    ProfileTable.location,
+    ProfileTable.linkedin,
+    ProfileTable.website,
+    ProfileTable.avatar,
+    ProfileTable.bio,
+    ProfileTable.theme,
+    ProfileTable.notifications,
+    ProfileTable.auto_save,
+    ProfileTable.subscription_plan,
+    ProfileTable.subscription_expires_at,
+    ProfileTable.resumes_created,
+    ProfileTable.profile_views,
+    ProfileTable.downloads_this_month,
+    ProfileTable.last_active,
+    ProfileTable.created_at,
+    ProfileTable.updated_at,
+)
+
+
+def _row_to_profile(r) -> ProfileData:
+    """Build ProfileData positionally from a _PROFILE_COLUMNS row tuple"""
+    return ProfileData.model_construct(
+        id=r[0],
+        name=r[1],
+        title=r[2],
+        email=r[3],
+        phone=r[4],
+        location=r[5],
+        linkedin=r[6],
+        website=r[7],
+        avatar=r[8],
+        bio=r[9],
+        preferences=ProfilePreferences.model_construct(
+            theme=r[10],
+            notifications=r[11],
+            auto_save=r[12]
+        ),
+        subscription=ProfileSubscription.model_construct(
+            plan=r[13],
+            expires_at=r[14]
+        ),
+        stats=ProfileStats.model_construct(
+            resumes_created=r[15],
+            profile_views=r[16],
+            downloads_this_month=r[17],
+            last_active=r[18]
+        ),
+        created_at=r[19],
+        updated_at=r[20]
+    )
+
 def db_profile_to_pydantic(db_profile: ProfileTable) -> ProfileData:
-    """Convert database profile to Pydantic model"""
-    return ProfileData(
+    """Convert database profile to Pydantic model.
+
+    Uses model_construct to skip validation - the data comes from typed
+    SQLAlchemy columns, so re-validating every field per row is wasted work.
+    """
+    return ProfileData.model_construct(
         id=db_profile.id,
         name=db_profile.name,
         title=db_profile.title,
@@ -23,16 +101,16 @@ def db_profile_to_pydantic(db_profile: ProfileTable) -> ProfileData:
         website=db_profile.website,
         avatar=db_profile.avatar,
         bio=db_profile.bio,
-        preferences=ProfilePreferences(
+        preferences=ProfilePreferences.model_construct(
             theme=db_profile.theme,
             notifications=db_profile.notifications,
             auto_save=db_profile.auto_save
         ),
-        subscription=ProfileSubscription(
+        subscription=ProfileSubscription.model_construct(
             plan=db_profile.subscription_plan,
             expires_at=db_profile.subscription_expires_at
         ),
-        stats=ProfileStats(
+        stats=ProfileStats.model_construct(
             resumes_created=db_profile.resumes_created,
             profile_views=db_profile.profile_views,
             downloads_this_month=db_profile.downloads_this_month,
@@ -43,10 +121,10 @@ def db_profile_to_pydantic(db_profile: ProfileTable) -> ProfileData:
     )
 
 @router.post("/profiles/", response_model=ProfileData)
-def create_profile(profile: ProfileDataCreate, db: Session = Depends(get_db)):
+async def create_profile(profile: ProfileDataCreate, db: AsyncSession = Depends(get_db)):
     """Create a new user profile"""
     profile_id = str(uuid.uuid4())
-    
+
     db_profile = ProfileTable(
         id=profile_id,
         name=profile.name,
@@ -58,82 +136,129 @@ def create_profile(profile: ProfileDataCreate, db: Session = Depends(get_db)):
         website=profile.website,
         bio=profile.bio
     )
-    
+
     db.add(db_profile)
-    db.commit()
-    db.refresh(db_profile)
-    
+    await db.commit()
+    await db.refresh(db_profile)
+
     return db_profile_to_pydantic(db_profile)
 
-@router.get("/profiles/{profile_id}", response_model=ProfileData)
-def get_profile(profile_id: str, db: Session = Depends(get_db)):
+@router.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str, db: AsyncSession = Depends(get_db)):
     """Get a user profile by ID"""
-    db_profile = db.query(ProfileTable).filter(ProfileTable.id == profile_id).first()
-    if db_profile is None:
+    cached = _profile_cache.get(profile_id)
+    if cached is not None:
+        profile_activity.touch(profile_id)
+        return Response(content=cached, media_type="application/json")
+
+    result = await db.execute(select(*_PROFILE_COLUMNS).where(ProfileTable.id == profile_id))
+    row = result.first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Profile not found")
-    
-    # Update last_active timestamp
-    db_profile.last_active = datetime.utcnow()
-    db.commit()
-    
-    return db_profile_to_pydantic(db_profile)
 
-@router.get("/profiles/", response_model=List[ProfileData])
-def list_profiles(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """List all user profiles"""
-    profiles = db.query(ProfileTable).offset(skip).limit(limit).all()
-    return [db_profile_to_pydantic(profile) for profile in profiles]
+    # Defer the last_active touch to the batched background flush
+    profile_activity.touch(profile_id)
+
+    # Serialize once through the cached adapter and cache the bytes, so
+    # cache hits skip both validation and serialization entirely
+    body = _PROFILE_ADAPTER.dump_json(_row_to_profile(row))
+    _profile_cache[profile_id] = body
+    return Response(content=body, media_type="application/json")
+
+@router.get("/profiles/")
+async def list_profiles(cursor: Optional[str] = None, limit: int = 100, db: AsyncSession = Depends(get_db)):
+    """List user profiles (keyset-paginated; pass the last id seen as cursor)"""
+    # Project only the list-view columns instead of materializing full rows,
+    # and paginate by id instead of OFFSET so deep pages stay O(limit)
+    query = select(
+        ProfileTable.id,
+        ProfileTable.name,
+        ProfileTable.title,
+        ProfileTable.email,
+        ProfileTable.avatar,
+        ProfileTable.updated_at
+    ).order_by(ProfileTable.id).limit(limit)
+    if cursor:
+        query = query.where(ProfileTable.id > cursor)
+
+    # Stream rows straight from the server-side cursor into the response so
+    # network send overlaps row fetch and memory stays flat per page
+    result = await db.stream(query)
+
+    async def profile_rows():
+        yield b"["
+        first = True
+        async for row in result:
+            if not first:
+                yield b","
+            first = False
+            yield orjson.dumps(dict(row._mapping))
+        yield b"]"
+
+    return StreamingResponse(profile_rows(), media_type="application/json")
 
 @router.put("/profiles/{profile_id}", response_model=ProfileData)
-def update_profile(profile_id: str, profile_update: ProfileDataUpdate, db: Session = Depends(get_db)):
+async def update_profile(profile_id: str, profile_update: ProfileDataUpdate, db: AsyncSession = Depends(get_db)):
     """Update a user profile"""
-    db_profile = db.query(ProfileTable).filter(ProfileTable.id == profile_id).first()
-    if db_profile is None:
-        raise HTTPException(status_code=404, detail="Profile not found")
-    
     update_data = profile_update.dict(exclude_unset=True)
-    
-    # Handle preferences separately
+
+    # Flatten nested preferences into their top-level columns
     if "preferences" in update_data:
         prefs = update_data.pop("preferences")
-        if "theme" in prefs:
-            db_profile.theme = prefs["theme"]
-        if "notifications" in prefs:
-            db_profile.notifications = prefs["notifications"]
-        if "auto_save" in prefs:
-            db_profile.auto_save = prefs["auto_save"]
-    
-    # Update other fields
-    for field, value in update_data.items():
-        setattr(db_profile, field, value)
-    
-    db_profile.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(db_profile)
-    
+        for field in ("theme", "notifications", "auto_save"):
+            if field in prefs:
+                update_data[field] = prefs[field]
+
+    if not update_data:
+        result = await db.execute(select(ProfileTable).where(ProfileTable.id == profile_id))
+        db_profile = result.scalar_one_or_none()
+        if db_profile is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return db_profile_to_pydantic(db_profile)
+
+    # Single UPDATE ... RETURNING instead of fetch + flush + refresh;
+    # updated_at is handled by the column's onupdate default
+    stmt = (
+        update(ProfileTable)
+        .where(ProfileTable.id == profile_id)
+        .values(**update_data)
+        .returning(ProfileTable)
+    )
+    result = await db.execute(stmt)
+    db_profile = result.scalar_one_or_none()
+    if db_profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    await db.commit()
+    _profile_cache.pop(profile_id, None)
+
     return db_profile_to_pydantic(db_profile)
 
 @router.delete("/profiles/{profile_id}")
-def delete_profile(profile_id: str, db: Session = Depends(get_db)):
+async def delete_profile(profile_id: str, db: AsyncSession = Depends(get_db)):
     """Delete a user profile"""
-    db_profile = db.query(ProfileTable).filter(ProfileTable.id == profile_id).first()
+    result = await db.execute(select(ProfileTable).where(ProfileTable.id == profile_id))
+    db_profile = result.scalar_one_or_none()
     if db_profile is None:
         raise HTTPException(status_code=404, detail="Profile not found")
-    
-    db.delete(db_profile)
-    db.commit()
-    
+
+    await db.delete(db_profile)
+    await db.commit()
+    _profile_cache.pop(profile_id, None)
+
     return {"message": "Profile deleted successfully"}
 
 @router.patch("/profiles/{profile_id}/stats")
-def update_profile_stats(profile_id: str, db: Session = Depends(get_db)):
+async def update_profile_stats(profile_id: str, db: AsyncSession = Depends(get_db)):
     """Update profile view count"""
-    db_profile = db.query(ProfileTable).filter(ProfileTable.id == profile_id).first()
-    if db_profile is None:
+    result = await db.execute(select(ProfileTable.id).where(ProfileTable.id == profile_id))
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Profile not found")
-    
-    db_profile.profile_views += 1
-    db_profile.last_active = datetime.utcnow()
-    db.commit()
-    
+
+    # Defer the view-count increment to the batched background flush, which
+    # applies it as an atomic profile_views = profile_views + n UPDATE -
+    # no read-modify-write, so concurrent views can't lose increments
+    profile_activity.record_view(profile_id)
+    _profile_cache.pop(profile_id, None)
+
     return {"message": "Profile stats updated"}
@@ -1,4 +1,8 @@
+import asyncio
+
+import orjson
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Dict, Any, Optional, List
 from ..services.chat_service import resume_agent
@@ -50,6 +54,23 @@ async def chat_with_user(request: ChatRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Chat service error: {str(e)}")
 
+@router.post("/chat/stream")
+async def chat_with_user_stream(request: ChatRequest):
+    """
+    Stream the assistant's reply as Server-Sent Events while it is generated
+    """
+    async def event_stream():
+        async for chunk in resume_agent.chat_stream(
+            message=request.message,
+            user_id=request.user_id or "default",
+            session_id=request.session_id,
+            context=request.context
+        ):
+            yield b"data: " + orjson.dumps({"text": chunk}) + b"\n\n"
+        yield b"data: [DONE]\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @router.get("/chat/info")
 async def get_chat_info():
     """
@@ -90,7 +111,7 @@ async def get_user_sessions(user_id: str, limit: int = 50):
     Get all chat sessions for a user
     """
     try:
-        sessions = conversation_manager.get_user_sessions(user_id, limit)
+        sessions = await asyncio.to_thread(conversation_manager.get_user_sessions, user_id, limit)
         return [SessionResponse(**session) for session in sessions]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get sessions: {str(e)}")
@@ -102,7 +123,7 @@ async def create_new_session(request: CreateSessionRequest):
     Create a new chat session for a user
     """
     try:
-        session_id = conversation_manager.create_new_session(request.user_id)
+        session_id = await asyncio.to_thread(conversation_manager.create_new_session, request.user_id)
         return CreateSessionResponse(
             session_id=session_id,
             user_id=request.user_id,
@@ -118,7 +139,7 @@ async def get_session_messages(session_id: str, user_id: str, limit: int = 100):
     Get all messages for a specific session
     """
     try:
-        messages = conversation_manager.get_session_messages(user_id, session_id, limit)
+        messages = await asyncio.to_thread(conversation_manager.get_session_messages, user_id, session_id, limit)
         return [MessageResponse(**message) for message in messages]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get session messages: {str(e)}")
@@ -130,7 +151,7 @@ async def delete_session(session_id: str, user_id: str):
     Delete a specific chat session and all its messages
     """
     try:
-        success = conversation_manager.delete_session(user_id, session_id)
+        success = await asyncio.to_thread(conversation_manager.delete_session, user_id, session_id)
         if success:
             return {"message": f"Session {session_id} deleted successfully"}
         else:
@@ -147,7 +168,7 @@ async def get_chat_stats(user_id: str):
     Get conversation statistics for a user
     """
     try:
-        stats = conversation_manager.get_user_conversation_stats(user_id)
+        stats = await asyncio.to_thread(conversation_manager.get_user_conversation_stats, user_id)
         return stats
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get chat stats: {str(e)}")
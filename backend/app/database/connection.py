@@ -1,20 +1,50 @@
+from typing import AsyncGenerator
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from .models import Base
 import os
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Async URL uses the asyncpg driver so DB I/O can overlap request handling
+ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1) if DATABASE_URL else DATABASE_URL
+
+# Connection setup dominates latency for short queries, so keep a pool of
+# long-lived connections and reuse them. LIFO checkout keeps the busiest
+# connections (and the server-side caches behind them) warm.
+POOL_OPTIONS = {
+    "pool_size": 20,
+    "max_overflow": 40,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+    "pool_use_lifo": True,
+}
+
+# Sync engine - still used by the service layer (tools, conversation manager)
+# expire_on_commit=False keeps ORM rows readable after commit instead of
+# silently re-SELECTing them on the next attribute access
+engine = create_engine(DATABASE_URL, **POOL_OPTIONS)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# Read-only sessions run on AUTOCOMMIT so each query skips the implicit
+# BEGIN/COMMIT round-trip pair; same pool, different execution options
+read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=read_engine)
+
+# Async engine - used by the API request path
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **POOL_OPTIONS)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
 
 # Create all tables
 def create_tables():
     Base.metadata.create_all(bind=engine)
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def create_tables_async():
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,80 +1,33 @@
 """
-Database migration utilities for resume builder
+Schema bootstrap: hand the database over to Alembic.
+
+The Alembic revisions under backend/alembic own the schema. This wrapper
+exists for databases provisioned by the retired boot-time DDL
+(create_tables / the old raw-SQL scripts here), which predate the
+alembic_version table: those get stamped at the baseline revision so
+`upgrade head` applies only what they are missing, instead of revision
+0001 re-issuing CREATE TABLE and crash-looping the container.
 """
-from sqlalchemy import text
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
 from .connection import engine
 import logging
 
 logger = logging.getLogger(__name__)
 
-
-def create_chat_tables():
-    """Create chat conversation and resume version tables"""
-    try:
-        
-        # Create chat_conversations table
-        chat_conversations_sql = """
-        CREATE TABLE IF NOT EXISTS chat_conversations (
-            id VARCHAR PRIMARY KEY DEFAULT gen_random_uuid()::text,
-            user_id VARCHAR NOT NULL,
-            session_id VARCHAR NOT NULL,
-            message_type VARCHAR(50) NOT NULL,
-            content TEXT NOT NULL,
-            metadata TEXT,
-            created_at TIMESTAMP DEFAULT NOW()
-        );
-        
-        CREATE INDEX IF NOT EXISTS idx_chat_conversations_user_id ON chat_conversations(user_id);
-        CREATE INDEX IF NOT EXISTS idx_chat_conversations_session_id ON chat_conversations(session_id);
-        CREATE INDEX IF NOT EXISTS idx_chat_conversations_created_at ON chat_conversations(created_at);
-        """
-        
-        # Create resume_versions table
-        resume_versions_sql = """
-        CREATE TABLE IF NOT EXISTS resume_versions (
-            id VARCHAR PRIMARY KEY DEFAULT gen_random_uuid()::text,
-            user_id VARCHAR NOT NULL,
-            resume_id VARCHAR NOT NULL,
-            version_number INTEGER NOT NULL,
-            content TEXT NOT NULL,
-            changes_summary TEXT,
-            created_by VARCHAR(100) DEFAULT 'user',
-            created_at TIMESTAMP DEFAULT NOW()
-        );
-        
-        CREATE INDEX IF NOT EXISTS idx_resume_versions_user_id ON resume_versions(user_id);
-        CREATE INDEX IF NOT EXISTS idx_resume_versions_resume_id ON resume_versions(resume_id);
-        """
-        
-        with engine.connect() as conn:
-            conn.execute(text(chat_conversations_sql))
-            conn.execute(text(resume_versions_sql))
-            conn.commit()
-            
-        logger.info("Successfully created chat conversation and resume version tables")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Failed to create chat tables: {str(e)}")
-        return False
+# Revision whose DDL matches what the retired boot-time scripts created
+BASELINE_REVISION = "0001"
 
 
-def run_migrations():
-    """Run all pending migrations"""
-    try:
-        # Create new tables
-        success = create_chat_tables()
-        
-        if success:
-            logger.info("All migrations completed successfully")
-        else:
-            logger.error("Some migrations failed")
-            
-        return success
-        
-    except Exception as e:
-        logger.error(f"Migration failed: {str(e)}")
-        return False
+def run_migrations(config_path: str = "alembic.ini") -> None:
+    """Stamp pre-Alembic schemas at the baseline, then upgrade to head"""
+    config = Config(config_path)
+    inspector = inspect(engine)
+    if not inspector.has_table("alembic_version") and inspector.has_table("chat_conversations"):
+        logger.info("Pre-Alembic schema detected; stamping baseline revision %s", BASELINE_REVISION)
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
 
 
 if __name__ == "__main__":
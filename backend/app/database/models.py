@@ -1,10 +1,22 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON, Index, MetaData, func
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from datetime import datetime
 import uuid
+from uuid6 import uuid7
 
-Base = declarative_base()
+# Single declarative Base for the whole app - import it from here rather than
+# creating another one, or tables get registered twice. The naming convention
+# keeps constraint/index names deterministic for Alembic autogenerate.
+NAMING_CONVENTION = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}
+
+Base = declarative_base(metadata=MetaData(naming_convention=NAMING_CONVENTION))
 
 class ProfileTable(Base):
     __tablename__ = "profiles"
@@ -52,35 +64,87 @@ class ResumeTable(Base):
     linkedin = Column(String, nullable=True)
     website = Column(String, nullable=True)
     summary = Column(Text, nullable=True)
-    experience = Column(Text, nullable=True)  # JSON string
-    skills = Column(Text, nullable=True)  # JSON string  
-    education = Column(Text, nullable=True)  # JSON string
+    # Stored as JSONB so reads get parsed data without a json.loads pass
+    experience = Column(JSONB, nullable=True)
+    skills = Column(JSONB, nullable=True)
+    education = Column(JSONB, nullable=True)
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # "Latest resume for this profile" runs on every context build and tool
+    # call; the composite index serves it as a single index seek
+    __table_args__ = (
+        Index('idx_resume_profile_updated', profile_id, updated_at.desc()),
+    )
+
 
 class ChatConversationTable(Base):
     __tablename__ = "chat_conversations"
-    
-    id = Column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
+
+    # Native uuid stores 16 bytes per index node vs 36 for the hex string;
+    # uuid7 is time-ordered so new rows append to the PK index instead of
+    # splitting random pages the way uuid4 does under write load
+    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid7)
     user_id = Column(String, nullable=False, index=True)  # References profiles.id
     session_id = Column(String, nullable=False, index=True)
     message_type = Column(String, nullable=False)  # 'human' or 'ai'
     content = Column(Text, nullable=False)
-    message_metadata = Column(Text, nullable=True)  # JSON string for additional data
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    message_metadata = Column(JSONB, nullable=True)  # Additional structured data
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=func.now(), index=True)
+
+    # Composite indexes matching the hot query shapes: per-session message
+    # fetches and per-user session listings ordered by recency
+    __table_args__ = (
+        Index('idx_chat_user_session_created', user_id, session_id, created_at.desc()),
+        Index('idx_chat_user_created', user_id, created_at.desc()),
+        # Human messages only, ascending: the first-message-per-session
+        # window scan in get_user_sessions reads straight off this index
+        Index(
+            'idx_chat_user_session_human', user_id, session_id, created_at,
+            postgresql_where=(message_type == 'human'),
+        ),
+        # Partial indexes for the change-tracking rows stored in this table;
+        # they stay tiny because chat messages are excluded
+        Index(
+            'idx_chat_ct_user_created', user_id, created_at.desc(),
+            postgresql_where=(message_type == 'change_tracking'),
+        ),
+        Index(
+            'idx_chat_ct_id', id,
+            postgresql_where=(message_type == 'change_tracking'),
+        ),
+    )
+
+
+class ChatSessionTable(Base):
+    """
+    Hot-path session blob: the recent messages of a session kept as one
+    JSONB array, appended in place so persisting a turn is a single UPDATE
+    and a context read is a single-row fetch. The array is trimmed to the
+    last few dozen entries on write; ChatConversationTable stays the
+    complete per-message audit log.
+    """
+    __tablename__ = "chat_sessions"
+
+    session_id = Column(String, primary_key=True)
+    user_id = Column(String, nullable=False, index=True)
+    # Array of {"t": message_type, "c": content} entries in turn order
+    messages = Column(JSONB, nullable=False, default=list)
+    # Lifetime message total; keeps window positions stable after trims
+    message_count = Column(Integer, nullable=False, default=0, server_default='0')
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
 class ResumeVersionTable(Base):
     __tablename__ = "resume_versions"
     
-    id = Column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
     user_id = Column(String, nullable=False, index=True)  # References profiles.id
     resume_id = Column(String, nullable=False, index=True)  # References resumes.id
     version_number = Column(Integer, nullable=False)
-    content = Column(Text, nullable=False)  # JSON string of resume content
+    content = Column(JSONB, nullable=False)  # Resume content snapshot
     changes_summary = Column(Text, nullable=True)
     created_by = Column(String, default="user")  # 'user' or 'ai'
     created_at = Column(DateTime, default=datetime.utcnow)
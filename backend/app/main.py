@@ -1,10 +1,25 @@
 import logging
+import os
 import sys
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from app.api.routes import router as api_router
 from app.api.profile_routes import router as profile_router
-from app.database.connection import create_tables
+from app.api.routes import (
+    ChatRequest,
+    ChatResponse,
+    CreateSessionRequest,
+    CreateSessionResponse,
+    MessageResponse,
+    RevertChangeRequest,
+    SessionResponse,
+    TrackChangeRequest,
+)
+from app.models.profile import ProfileData, ProfileDataCreate, ProfileDataUpdate, ProfileListItem
+from app.services.profile_activity import profile_activity
+from app.services.chat_service import aclose_http_client, resume_agent
 
 # Configure logging
 logging.basicConfig(
@@ -21,7 +36,9 @@ logging.getLogger("app.services.resume_tools").setLevel(logging.INFO)
 logging.getLogger("httpcore").setLevel(logging.WARNING)  # Reduce HTTP client noise
 logging.getLogger("httpx").setLevel(logging.WARNING)     # Reduce HTTP client noise
 
-app = FastAPI()
+# orjson serializes datetimes/UUIDs natively and is much faster than the
+# stdlib encoder on the large list responses (profiles, history, messages)
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -32,10 +49,69 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Create database tables on startup
+# Compress large JSON bodies (profile lists, change history, session
+# messages); level 4 trades ~1% CPU for a 5-10x smaller wire size
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
+# Dev-only guard: flag lazy-load (N+1) regressions before they ship. The
+# sqlalchemy extension import only patches the ORM to emit signals; the
+# middleware below subscribes listeners around each request that report
+# them, so any relationship() that silently adds per-row SELECTs gets
+# logged.
+if os.environ.get("ENV") == "dev":
+    try:
+        from nplusone.core import listeners as nplusone_listeners
+        import nplusone.ext.sqlalchemy  # noqa: F401
+    except ImportError:
+        logging.getLogger(__name__).warning("ENV=dev but nplusone is not installed; lazy-load guard disabled")
+    else:
+        class _NPlusOneLogReporter:
+            """Notify target for nplusone listeners: log, never raise"""
+            whitelist: list = []
+
+            def notify(self, message):
+                if not message.match(self.whitelist):
+                    logging.getLogger("nplusone").warning(message.message)
+
+        _nplusone_reporter = _NPlusOneLogReporter()
+
+        @app.middleware("http")
+        async def nplusone_guard(request, call_next):
+            active = [
+                listener_type(_nplusone_reporter)
+                for listener_type in nplusone_listeners.listeners.values()
+            ]
+            for listener in active:
+                listener.setup()
+            try:
+                return await call_next(request)
+            finally:
+                for listener in active:
+                    listener.teardown()
+
+        logging.getLogger(__name__).info("nplusone lazy-load guard enabled")
+
+# Schema is managed by Alembic (run `alembic upgrade head` before starting
+# workers); doing DDL here slowed every worker boot with a DB round-trip
 @app.on_event("startup")
-def startup_event():
-    create_tables()
+async def startup_event():
+    profile_activity.start()
+    resume_agent.start_save_worker()
+
+    # Pre-build pydantic schemas so the first request per model doesn't pay
+    # validator/serializer construction cost
+    for model in (
+        ProfileData, ProfileDataCreate, ProfileDataUpdate, ProfileListItem,
+        ChatRequest, ChatResponse, CreateSessionRequest, CreateSessionResponse,
+        MessageResponse, RevertChangeRequest, SessionResponse, TrackChangeRequest,
+    ):
+        model.model_rebuild()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await profile_activity.stop()
+    await resume_agent.stop_save_worker()
+    await aclose_http_client()
 
 @app.get("/")
 def read_root():
@@ -34,6 +34,15 @@ class ProfileData(BaseModel):
     created_at: datetime = datetime.now()
     updated_at: datetime = datetime.now()
 
+class ProfileListItem(BaseModel):
+    """Slim projection of a profile for list views"""
+    id: str
+    name: str
+    title: str
+    email: str
+    avatar: Optional[str] = None
+    updated_at: datetime
+
 class ProfileDataCreate(BaseModel):
     name: str
     title: str
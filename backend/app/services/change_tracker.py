@@ -3,12 +3,19 @@ Change Tracker Service for Resume Editing System
 Monitors and logs resume modifications with diff generation
 """
 from typing import Dict, Any, List, Optional, Tuple
-import json
-import uuid
+import orjson
+from uuid6 import uuid7
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
-import difflib
+from functools import lru_cache
+try:
+    # Rust implementation, byte-for-byte compatible and several times faster
+    # on multi-KB summary/description fields
+    from difflib_rs import unified_diff
+except ImportError:
+    from difflib import unified_diff
+from dictdiffer import diff as dict_diff
 from ..database.connection import SessionLocal
 from ..database.models import ChatConversationTable  # We'll extend the DB schema later
 import logging
@@ -33,6 +40,49 @@ class ChangeType(Enum):
     OTHER = "other"
 
 
+# Value -> member lookup; avoids the enum _missing_ scan per loaded row
+_CHANGE_TYPE = {change_type.value: change_type for change_type in ChangeType}
+
+
+def _canonical(value: Any) -> bytes:
+    """Key-order-independent serialization for cheap equality checks"""
+    return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+
+
+def _compute_diff(old_value: Any, new_value: Any) -> Dict[str, Any]:
+    """Build the diff payload for a pair of values"""
+    if isinstance(old_value, str) and isinstance(new_value, str):
+        # Text diff
+        diff_lines = list(unified_diff(
+            old_value.splitlines(keepends=True),
+            new_value.splitlines(keepends=True),
+            fromfile='old',
+            tofile='new'
+        ))
+
+        return {
+            "type": "text",
+            "old_value": old_value,
+            "new_value": new_value,
+            "diff_lines": diff_lines,
+            "char_diff": len(new_value) - len(old_value)
+        }
+    else:
+        # JSON diff
+        return {
+            "type": "json",
+            "old_value": old_value,
+            "new_value": new_value,
+            "summary": f"Changed from {type(old_value).__name__} to {type(new_value).__name__}"
+        }
+
+
+@lru_cache(maxsize=512)
+def _generate_diff_cached(old_blob: bytes, new_blob: bytes) -> Dict[str, Any]:
+    """Memoized diff keyed on the serialized values (bytes hash at C speed)"""
+    return _compute_diff(orjson.loads(old_blob), orjson.loads(new_blob))
+
+
 @dataclass
 class ResumeChange:
     """Represents a single resume change"""
@@ -96,12 +146,20 @@ class ChangeTracker:
             List of detected changes
         """
         try:
+            # Fast no-op check: a C-level byte comparison of the canonical
+            # serializations beats walking both trees in Python. Autosaves
+            # without edits bail out here.
+            if _canonical(old_resume) == _canonical(new_resume):
+                return []
+
             changes = self._detect_changes(old_resume, new_resume)
             tracked_changes = []
-            
+
             for change_data in changes:
                 change = ResumeChange(
-                    id=str(uuid.uuid4()),
+                    # Time-ordered ids keep inserts clustered at the right edge
+                    # of the PK index instead of fragmenting it
+                    id=str(uuid7()),
                     user_id=user_id,
                     session_id=session_id,
                     change_type=change_data["type"],
@@ -113,11 +171,11 @@ class ChangeTracker:
                     timestamp=datetime.utcnow(),
                     metadata=change_data.get("metadata")
                 )
-                
-                # Save to database (placeholder - will implement with proper schema)
-                self._save_change(change)
                 tracked_changes.append(change)
-            
+
+            # One session, one INSERT batch, one transaction for the whole edit
+            self._save_changes(tracked_changes)
+
             logger.info(f"Tracked {len(tracked_changes)} changes for user {user_id}")
             return tracked_changes
             
@@ -145,10 +203,10 @@ class ChangeTracker:
             List of changes as dictionaries
         """
         try:
-            # Placeholder implementation - will implement with proper database schema
-            changes = self._load_changes_from_storage(user_id, session_id, limit, change_type)
-            return [change.to_dict() for change in changes]
-            
+            # Rows are already stored in to_dict() form, so return the parsed
+            # dicts directly instead of round-tripping through the dataclass
+            return self._load_change_rows(user_id, session_id, limit, change_type)
+
         except Exception as e:
             logger.error(f"Failed to get change history: {str(e)}")
             return []
@@ -203,7 +261,7 @@ class ChangeTracker:
             
             # Create revert change record
             revert_change = ResumeChange(
-                id=str(uuid.uuid4()),
+                id=str(uuid7()),
                 user_id=user_id,
                 session_id=change.session_id,
                 change_type=change.change_type,
@@ -232,116 +290,108 @@ class ChangeTracker:
             logger.error(f"Failed to revert change: {str(e)}")
             return False, None
     
+    # Sections with array semantics: (add, edit, delete) change types
+    _ARRAY_SECTION_TYPES = {
+        "experience": (ChangeType.EXPERIENCE_ADD, ChangeType.EXPERIENCE_EDIT, ChangeType.EXPERIENCE_DELETE),
+        "education": (ChangeType.EDUCATION_ADD, ChangeType.EDUCATION_EDIT, ChangeType.EDUCATION_DELETE),
+    }
+
     def _detect_changes(self, old_resume: Dict[str, Any], new_resume: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Detect changes between two resume versions.
+
+        Uses dictdiffer for a single structured tree walk instead of separate
+        per-section scans; skills keep their set semantics and are handled
+        separately in _detect_skills_changes.
         """
         changes = []
-        
-        # Check personal info changes
-        old_personal = old_resume.get("personalInfo", {})
-        new_personal = new_resume.get("personalInfo", {})
-        changes.extend(self._detect_dict_changes(old_personal, new_personal, "personalInfo", ChangeType.PERSONAL_INFO))
-        
-        # Check summary changes
-        old_summary = old_resume.get("summary", "")
-        new_summary = new_resume.get("summary", "")
-        if old_summary != new_summary:
-            changes.append({
+
+        for op, path, values in dict_diff(old_resume, new_resume, ignore={"skills"}):
+            parts = path.split(".") if isinstance(path, str) else list(path)
+            section = str(parts[0]) if parts and parts[0] != "" else None
+
+            if section is None:
+                # Top-level key added/removed (e.g. summary appearing for the
+                # first time): dispatch each key onto its section handler
+                for key, value in values:
+                    old_value = value if op == "remove" else None
+                    new_value = value if op == "add" else None
+                    changes.extend(self._classify_change(str(key), [str(key)], old_value, new_value))
+            elif op == "change":
+                old_value, new_value = values
+                changes.extend(self._classify_change(section, parts, old_value, new_value))
+            else:
+                # 'add' / 'remove' of nested items: values is a list of
+                # (key, value) pairs under the parent path
+                for key, value in values:
+                    old_value = value if op == "remove" else None
+                    new_value = value if op == "add" else None
+                    changes.extend(self._classify_change(section, parts + [key], old_value, new_value))
+
+        # Skills are compared as sets, not positionally; skip the scan
+        # entirely when the section is untouched
+        old_skills = old_resume.get("skills", {})
+        new_skills = new_resume.get("skills", {})
+        if old_skills is not new_skills and _canonical(old_skills) != _canonical(new_skills):
+            changes.extend(self._detect_skills_changes(old_skills, new_skills))
+
+        return changes
+
+    def _classify_change(self, section: str, parts: List[Any], old_value: Any, new_value: Any) -> List[Dict[str, Any]]:
+        """Map a single diff operation onto the ChangeType taxonomy"""
+        field_path = ".".join(str(part) for part in parts)
+
+        if section == "personalInfo":
+            field = str(parts[-1])
+            return [{
+                "type": ChangeType.PERSONAL_INFO,
+                "section": "personalInfo",
+                "field_path": field_path,
+                "old_value": old_value,
+                "new_value": new_value,
+                "description": f"Updated {field} in personalInfo",
+                "metadata": {"field": field}
+            }]
+
+        if section == "summary":
+            old_text = old_value or ""
+            new_text = new_value or ""
+            return [{
                 "type": ChangeType.SUMMARY,
                 "section": "summary",
                 "field_path": "summary",
-                "old_value": old_summary,
-                "new_value": new_summary,
+                "old_value": old_value,
+                "new_value": new_value,
                 "description": "Updated professional summary",
-                "metadata": {"char_diff": len(new_summary) - len(old_summary)}
-            })
-        
-        # Check experience changes
-        old_experience = old_resume.get("experience", [])
-        new_experience = new_resume.get("experience", [])
-        changes.extend(self._detect_array_changes(old_experience, new_experience, "experience", "Experience"))
-        
-        # Check skills changes
-        old_skills = old_resume.get("skills", {})
-        new_skills = new_resume.get("skills", {})
-        changes.extend(self._detect_skills_changes(old_skills, new_skills))
-        
-        # Check education changes
-        old_education = old_resume.get("education", [])
-        new_education = new_resume.get("education", [])
-        changes.extend(self._detect_array_changes(old_education, new_education, "education", "Education"))
-        
-        return changes
-    
-    def _detect_dict_changes(self, old_dict: Dict, new_dict: Dict, section: str, change_type: ChangeType) -> List[Dict[str, Any]]:
-        """Detect changes in dictionary fields"""
-        changes = []
-        all_keys = set(old_dict.keys()) | set(new_dict.keys())
-        
-        for key in all_keys:
-            old_value = old_dict.get(key)
-            new_value = new_dict.get(key)
-            
-            if old_value != new_value:
-                changes.append({
-                    "type": change_type,
-                    "section": section,
-                    "field_path": f"{section}.{key}",
-                    "old_value": old_value,
-                    "new_value": new_value,
-                    "description": f"Updated {key} in {section}",
-                    "metadata": {"field": key}
-                })
-        
-        return changes
-    
-    def _detect_array_changes(self, old_array: List, new_array: List, section: str, section_name: str) -> List[Dict[str, Any]]:
-        """Detect changes in array fields like experience or education"""
-        changes = []
-        
-        # Simple approach: detect length changes and item modifications
-        if len(old_array) != len(new_array):
-            if len(new_array) > len(old_array):
-                # Items added
-                for i in range(len(old_array), len(new_array)):
-                    changes.append({
-                        "type": getattr(ChangeType, f"{section.upper()}_ADD"),
-                        "section": section,
-                        "field_path": f"{section}.{i}",
-                        "old_value": None,
-                        "new_value": new_array[i],
-                        "description": f"Added new {section_name.lower()} entry",
-                        "metadata": {"index": i}
-                    })
+                "metadata": {"char_diff": len(new_text) - len(old_text)}
+            }]
+
+        if section in self._ARRAY_SECTION_TYPES:
+            add_type, edit_type, delete_type = self._ARRAY_SECTION_TYPES[section]
+            index = int(parts[1]) if len(parts) > 1 and str(parts[1]).isdigit() else None
+
+            if old_value is None and new_value is not None:
+                change_type = add_type
+                description = f"Added new {section} entry"
+            elif new_value is None and old_value is not None:
+                change_type = delete_type
+                description = f"Removed {section} entry"
             else:
-                # Items removed
-                for i in range(len(new_array), len(old_array)):
-                    changes.append({
-                        "type": getattr(ChangeType, f"{section.upper()}_DELETE"),
-                        "section": section,
-                        "field_path": f"{section}.{i}",
-                        "old_value": old_array[i],
-                        "new_value": None,
-                        "description": f"Removed {section_name.lower()} entry",
-                        "metadata": {"index": i}
-                    })
-        
-        # Check modifications in existing items
-        min_len = min(len(old_array), len(new_array))
-        for i in range(min_len):
-            if old_array[i] != new_array[i]:
-                changes.append({
-                    "type": getattr(ChangeType, f"{section.upper()}_EDIT"),
-                    "section": section,
-                    "field_path": f"{section}.{i}",
-                    "old_value": old_array[i],
-                    "new_value": new_array[i],
-                    "description": f"Modified {section_name.lower()} entry #{i+1}",
-                    "metadata": {"index": i}
-                })
-        
-        return changes
+                change_type = edit_type
+                description = f"Modified {section} entry" + (f" #{index + 1}" if index is not None else "")
+
+            return [{
+                "type": change_type,
+                "section": section,
+                "field_path": field_path,
+                "old_value": old_value,
+                "new_value": new_value,
+                "description": description,
+                "metadata": {"index": index}
+            }]
+
+        # Sections outside the tracked taxonomy
+        return []
     
     def _detect_skills_changes(self, old_skills: Dict, new_skills: Dict) -> List[Dict[str, Any]]:
         """Detect changes in skills section"""
@@ -350,131 +400,131 @@ class ChangeTracker:
         for skill_type in ["technical", "soft"]:
             old_list = old_skills.get(skill_type, [])
             new_list = new_skills.get(skill_type, [])
-            
-            if old_list != new_list:
-                changes.append({
-                    "type": ChangeType.SKILLS_EDIT,
-                    "section": "skills",
-                    "field_path": f"skills.{skill_type}",
-                    "old_value": old_list,
-                    "new_value": new_list,
-                    "description": f"Updated {skill_type} skills",
-                    "metadata": {
-                        "skill_type": skill_type,
-                        "added": list(set(new_list) - set(old_list)),
-                        "removed": list(set(old_list) - set(new_list))
-                    }
-                })
+
+            # Skills are bag-of-strings: build each set once and compare by
+            # membership, so a pure reordering is not reported as a change
+            old_set = set(old_list)
+            new_set = set(new_list)
+            added = new_set - old_set
+            removed = old_set - new_set
+            if not added and not removed:
+                continue
+
+            changes.append({
+                "type": ChangeType.SKILLS_EDIT,
+                "section": "skills",
+                "field_path": f"skills.{skill_type}",
+                "old_value": old_list,
+                "new_value": new_list,
+                "description": f"Updated {skill_type} skills",
+                "metadata": {
+                    "skill_type": skill_type,
+                    "added": list(added),
+                    "removed": list(removed)
+                }
+            })
         
         return changes
     
     def _generate_diff(self, old_value: Any, new_value: Any) -> Dict[str, Any]:
-        """Generate detailed diff information"""
-        if isinstance(old_value, str) and isinstance(new_value, str):
-            # Text diff
-            diff_lines = list(difflib.unified_diff(
-                old_value.splitlines(keepends=True),
-                new_value.splitlines(keepends=True),
-                fromfile='old',
-                tofile='new'
-            ))
-            
-            return {
-                "type": "text",
-                "old_value": old_value,
-                "new_value": new_value,
-                "diff_lines": diff_lines,
-                "char_diff": len(new_value) - len(old_value)
-            }
-        else:
-            # JSON diff
-            return {
-                "type": "json",
-                "old_value": old_value,
-                "new_value": new_value,
-                "summary": f"Changed from {type(old_value).__name__} to {type(new_value).__name__}"
-            }
-    
+        """
+        Generate detailed diff information.
+
+        Change records are immutable once committed, so results are memoized
+        on the serialized values — UI history polling hits the same change ids
+        repeatedly and should not recompute the unified diff each time.
+        """
+        try:
+            return _generate_diff_cached(orjson.dumps(old_value), orjson.dumps(new_value))
+        except TypeError:
+            # Non-JSON-serializable values can't be cache keys; diff directly
+            return _compute_diff(old_value, new_value)
+
+
     def _save_change(self, change: ResumeChange) -> bool:
+        """Save a single change (thin wrapper over the batch path)"""
+        return self._save_changes([change])
+
+    def _save_changes(self, changes: List[ResumeChange]) -> bool:
         """
-        Save change to database.
+        Save a batch of changes in one session and one transaction.
         Placeholder implementation using conversation table for now.
         """
+        if not changes:
+            return True
+
         try:
             with SessionLocal() as db:
                 # Store as a special message type for now
-                change_record = ChatConversationTable(
-                    id=change.id,
-                    user_id=change.user_id,
-                    session_id=change.session_id or "system",
-                    message_type="change_tracking",
-                    content=json.dumps(change.to_dict()),
-                    message_metadata=json.dumps({
-                        "change_type": change.change_type.value,
-                        "section": change.section,
-                        "field_path": change.field_path
-                    }),
-                    created_at=change.timestamp
-                )
-                
-                db.add(change_record)
+                change_records = [
+                    ChatConversationTable(
+                        id=change.id,
+                        user_id=change.user_id,
+                        session_id=change.session_id or "system",
+                        message_type="change_tracking",
+                        content=orjson.dumps(change.to_dict()).decode(),
+                        message_metadata={
+                            "change_type": change.change_type.value,
+                            "section": change.section,
+                            "field_path": change.field_path
+                        },
+                        created_at=change.timestamp
+                    )
+                    for change in changes
+                ]
+
+                db.add_all(change_records)
                 db.commit()
-                
+
                 return True
-                
+
         except Exception as e:
-            logger.error(f"Failed to save change: {str(e)}")
+            logger.error(f"Failed to save changes: {str(e)}")
             return False
     
-    def _load_changes_from_storage(
-        self, 
-        user_id: str, 
+    def _load_change_rows(
+        self,
+        user_id: str,
         session_id: Optional[str] = None,
         limit: int = 50,
         change_type: Optional[ChangeType] = None
-    ) -> List[ResumeChange]:
-        """Load changes from database storage"""
+    ) -> List[Dict[str, Any]]:
+        """
+        Load change history as plain dicts.
+
+        Rows are stored as to_dict() JSON, so no dataclass reconstruction is
+        needed; the change_type filter runs in SQL against the JSONB metadata
+        so LIMIT applies after filtering rather than before.
+        """
         try:
             with SessionLocal() as db:
-                query = db.query(ChatConversationTable).filter(
+                query = db.query(ChatConversationTable.content).filter(
                     ChatConversationTable.user_id == user_id,
                     ChatConversationTable.message_type == "change_tracking"
                 )
-                
+
                 if session_id:
                     query = query.filter(ChatConversationTable.session_id == session_id)
-                
+
+                if change_type:
+                    query = query.filter(
+                        ChatConversationTable.message_metadata.op('->>')('change_type') == change_type.value
+                    )
+
                 records = query.order_by(
                     ChatConversationTable.created_at.desc()
                 ).limit(limit).all()
-                
+
                 changes = []
-                for record in records:
+                for (content,) in records:
                     try:
-                        change_data = json.loads(record.content)
-                        change = ResumeChange(
-                            id=change_data["id"],
-                            user_id=change_data["user_id"],
-                            session_id=change_data.get("session_id"),
-                            change_type=ChangeType(change_data["change_type"]),
-                            section=change_data["section"],
-                            field_path=change_data["field_path"],
-                            old_value=change_data["old_value"],
-                            new_value=change_data["new_value"],
-                            description=change_data["description"],
-                            timestamp=datetime.fromisoformat(change_data["timestamp"]),
-                            metadata=change_data.get("metadata")
-                        )
-                        
-                        if not change_type or change.change_type == change_type:
-                            changes.append(change)
-                            
-                    except (json.JSONDecodeError, KeyError, ValueError) as e:
-                        logger.warning(f"Failed to parse change record {record.id}: {str(e)}")
+                        changes.append(orjson.loads(content))
+                    except orjson.JSONDecodeError as e:
+                        logger.warning(f"Failed to parse change record: {str(e)}")
                         continue
-                
+
                 return changes
-                
+
         except Exception as e:
             logger.error(f"Failed to load changes: {str(e)}")
             return []
@@ -491,12 +541,12 @@ class ChangeTracker:
                 if not record:
                     return None
                 
-                change_data = json.loads(record.content)
+                change_data = orjson.loads(record.content)
                 return ResumeChange(
                     id=change_data["id"],
                     user_id=change_data["user_id"],
                     session_id=change_data.get("session_id"),
-                    change_type=ChangeType(change_data["change_type"]),
+                    change_type=_CHANGE_TYPE[change_data["change_type"]],
                     section=change_data["section"],
                     field_path=change_data["field_path"],
                     old_value=change_data["old_value"],
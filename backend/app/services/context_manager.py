@@ -2,15 +2,83 @@
 Context Manager for Resume Editing System
 Implements hybrid smart context as per design document
 """
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List
-from sqlalchemy.orm import Session
-from ..database.connection import SessionLocal
+from ..database.connection import ReadSessionLocal
 from ..database.models import ProfileTable, ResumeTable
-import json
+import orjson
 import logging
+from cachetools import TTLCache
+from sqlalchemy import func
+from sqlalchemy.orm import aliased
 
 logger = logging.getLogger(__name__)
 
+# Base context is identical between turns until the resume or profile row
+# changes, so entries are keyed by (user_id, profile.last_active,
+# max(resume.updated_at)) - any write moves one of the timestamps and the
+# stale entry simply stops being hit. The TTL bounds clock-skew staleness.
+_BASE_CONTEXT_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def _json_column_items(value) -> Optional[Any]:
+    """
+    Return a JSONB column value as Python data.
+    Tolerates legacy rows that still hold a JSON string.
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        # Legacy text rows only; JSONB columns arrive already parsed
+        try:
+            return orjson.loads(value)
+        except (orjson.JSONDecodeError, TypeError):
+            return None
+    return value
+
+
+# The capability list and fallback context are pure immutable data; built
+# once at import instead of reallocating the same dicts per call
+_AVAILABLE_TOOLS = tuple(MappingProxyType(entry) for entry in (
+    {
+        "name": "get_resume_section",
+        "description": "Get detailed content of a specific resume section",
+        "parameters": ("section_name",)
+    },
+    {
+        "name": "get_full_profile",
+        "description": "Get complete profile information",
+        "parameters": ("user_id",)
+    },
+    {
+        "name": "update_work_experience",
+        "description": "Add or update work experience entry",
+        "parameters": ("experience_data", "action")
+    },
+    {
+        "name": "edit_professional_summary",
+        "description": "Update the professional summary section",
+        "parameters": ("new_summary",)
+    },
+    {
+        "name": "manage_skills",
+        "description": "Add, remove, or update skills",
+        "parameters": ("skills_data", "action")
+    },
+    {
+        "name": "search_resume_content",
+        "description": "Search for specific content in resume",
+        "parameters": ("query",)
+    }
+))
+
+_FALLBACK_CONTEXT = MappingProxyType({
+    "resume_outline": MappingProxyType({"exists": False, "error": "Could not load resume"}),
+    "profile_basic": MappingProxyType({"exists": False, "error": "Could not load profile"}),
+    "recent_activity": MappingProxyType({"recent_session": "Database connection error"}),
+    "capabilities": _AVAILABLE_TOOLS
+})
+
 
 class ContextManager:
     """
@@ -27,31 +95,68 @@ class ContextManager:
         Returns essential info without full content.
         """
         try:
-            with SessionLocal() as db:
+            with ReadSessionLocal() as db:
+                # Cheap version probe: two timestamps decide whether the
+                # cached context is still current
+                latest_resume_at = db.query(
+                    func.max(ResumeTable.updated_at)
+                ).filter(ResumeTable.profile_id == user_id).scalar_subquery()
+                version = db.query(
+                    ProfileTable.last_active, latest_resume_at
+                ).filter(ProfileTable.id == user_id).first()
+
+                cache_key = (user_id, version[0] if version else None, version[1] if version else None)
+                cached = _BASE_CONTEXT_CACHE.get(cache_key)
+                if cached is not None:
+                    return cached
+
+                # One round trip fetches the profile and its latest resume.
+                # row_number() over the per-profile partition picks the newest
+                # resume inside the join, so this generalizes to "latest
+                # resume per profile" for a list of users unchanged
+                rn = func.row_number().over(
+                    partition_by=ResumeTable.profile_id,
+                    order_by=ResumeTable.updated_at.desc()
+                ).label("rn")
+                latest = db.query(ResumeTable, rn).filter(
+                    ResumeTable.profile_id == user_id
+                ).subquery()
+                latest_resume = aliased(ResumeTable, latest)
+
+                row = db.query(ProfileTable, latest_resume).outerjoin(
+                    latest_resume,
+                    (latest.c.profile_id == ProfileTable.id) & (latest.c.rn == 1)
+                ).filter(ProfileTable.id == user_id).first()
+
+                if row is not None:
+                    profile, resume = row
+                else:
+                    # No profile row; a resume may still exist for the id
+                    profile = None
+                    resume = db.query(ResumeTable).filter(
+                        ResumeTable.profile_id == user_id
+                    ).order_by(ResumeTable.updated_at.desc()).first()
+
                 context = {
-                    "resume_outline": self._get_resume_structure(db, user_id),
-                    "profile_basic": self._get_basic_profile(db, user_id),
-                    "recent_activity": self._get_recent_changes(db, user_id),
+                    "resume_outline": self._get_resume_structure(resume),
+                    "profile_basic": self._get_basic_profile(profile),
+                    "recent_activity": self._get_recent_changes(profile),
                     "capabilities": self._get_available_tools()
                 }
-                
-                logger.info(f"Generated base context for user {user_id}")
+
+                _BASE_CONTEXT_CACHE[cache_key] = context
+                logger.info("Generated base context for user %s", user_id)
                 return context
-                
+
         except Exception as e:
             logger.error(f"Failed to get base context for user {user_id}: {str(e)}")
             return self._get_fallback_context()
-    
-    def _get_resume_structure(self, db: Session, user_id: str) -> Dict[str, Any]:
+
+    def _get_resume_structure(self, resume: Optional[ResumeTable]) -> Dict[str, Any]:
         """
         Get resume structure without full content - token efficient.
         """
         try:
-            # Get the most recent resume for this user
-            resume = db.query(ResumeTable).filter(
-                ResumeTable.profile_id == user_id
-            ).order_by(ResumeTable.updated_at.desc()).first()
-            
             if not resume:
                 return {
                     "exists": False,
@@ -59,31 +164,22 @@ class ContextManager:
                     "message": "No resume found - ready to create one"
                 }
             
-            # Parse JSON fields to count items
+            # Count items from the JSONB fields
             experience_count = 0
             education_count = 0
             skills_count = 0
-            
-            try:
-                if resume.experience:
-                    experience_data = json.loads(resume.experience)
-                    experience_count = len(experience_data) if isinstance(experience_data, list) else 1
-            except:
-                pass
-                
-            try:
-                if resume.education:
-                    education_data = json.loads(resume.education)
-                    education_count = len(education_data) if isinstance(education_data, list) else 1
-            except:
-                pass
-                
-            try:
-                if resume.skills:
-                    skills_data = json.loads(resume.skills)
-                    skills_count = len(skills_data) if isinstance(skills_data, list) else 1
-            except:
-                pass
+
+            experience_data = _json_column_items(resume.experience)
+            if experience_data is not None:
+                experience_count = len(experience_data) if isinstance(experience_data, list) else 1
+
+            education_data = _json_column_items(resume.education)
+            if education_data is not None:
+                education_count = len(education_data) if isinstance(education_data, list) else 1
+
+            skills_data = _json_column_items(resume.skills)
+            if skills_data is not None:
+                skills_count = len(skills_data) if isinstance(skills_data, list) else 1
             
             return {
                 "exists": True,
@@ -102,13 +198,11 @@ class ContextManager:
             logger.error(f"Error getting resume structure: {str(e)}")
             return {"exists": False, "error": "Could not load resume structure"}
     
-    def _get_basic_profile(self, db: Session, user_id: str) -> Dict[str, Any]:
+    def _get_basic_profile(self, profile: Optional[ProfileTable]) -> Dict[str, Any]:
         """
         Get basic profile info - name, title, location only.
         """
         try:
-            profile = db.query(ProfileTable).filter(ProfileTable.id == user_id).first()
-            
             if not profile:
                 return {
                     "exists": False,
@@ -127,14 +221,12 @@ class ContextManager:
             logger.error(f"Error getting basic profile: {str(e)}")
             return {"exists": False, "error": "Could not load profile"}
     
-    def _get_recent_changes(self, db: Session, user_id: str) -> Dict[str, Any]:
+    def _get_recent_changes(self, profile: Optional[ProfileTable]) -> Dict[str, Any]:
         """
         Get recent activity summary - what was last modified.
         """
         try:
-            # For now, just return the last activity from profile
-            profile = db.query(ProfileTable).filter(ProfileTable.id == user_id).first()
-            
+            # For now, just report the last activity from the loaded profile
             recent_activity = {
                 "last_active": profile.last_active.isoformat() if profile and profile.last_active else None,
                 "resumes_created": profile.resumes_created if profile else 0,
@@ -147,61 +239,42 @@ class ContextManager:
             logger.error(f"Error getting recent changes: {str(e)}")
             return {"recent_session": "Unable to load recent activity"}
     
-    def _get_available_tools(self) -> List[Dict[str, Any]]:
+    def _get_available_tools(self):
         """
         List available tools for the LLM to use.
         """
-        return [
-            {
-                "name": "get_resume_section",
-                "description": "Get detailed content of a specific resume section",
-                "parameters": ["section_name"]
-            },
-            {
-                "name": "get_full_profile",
-                "description": "Get complete profile information",
-                "parameters": ["user_id"]
-            },
-            {
-                "name": "update_work_experience",
-                "description": "Add or update work experience entry",
-                "parameters": ["experience_data", "action"]
-            },
-            {
-                "name": "edit_professional_summary",
-                "description": "Update the professional summary section",
-                "parameters": ["new_summary"]
-            },
-            {
-                "name": "manage_skills",
-                "description": "Add, remove, or update skills",
-                "parameters": ["skills_data", "action"]
-            },
-            {
-                "name": "search_resume_content",
-                "description": "Search for specific content in resume",
-                "parameters": ["query"]
-            }
-        ]
-    
+        return _AVAILABLE_TOOLS
+
     def _get_fallback_context(self) -> Dict[str, Any]:
         """
         Fallback context when database queries fail.
         """
-        return {
-            "resume_outline": {"exists": False, "error": "Could not load resume"},
-            "profile_basic": {"exists": False, "error": "Could not load profile"},
-            "recent_activity": {"recent_session": "Database connection error"},
-            "capabilities": self._get_available_tools()
-        }
+        # Shallow copy of the frozen template so callers can add keys
+        return dict(_FALLBACK_CONTEXT)
     
+    @staticmethod
+    def _approx_char_size(value: Any) -> int:
+        """Sum the character weight of a nested context without serializing it"""
+        if isinstance(value, str):
+            return len(value)
+        if isinstance(value, (dict, MappingProxyType)):
+            return sum(
+                len(k) + ContextManager._approx_char_size(v)
+                for k, v in value.items()
+            )
+        if isinstance(value, (list, tuple)):
+            return sum(ContextManager._approx_char_size(item) for item in value)
+        # numbers, bools, None - a few characters each once rendered
+        return 4
+
     def estimate_context_tokens(self, context: Dict[str, Any]) -> int:
         """
         Rough estimation of token count for context.
-        Rule of thumb: 1 token ≈ 4 characters for English text.
+        Rule of thumb: 1 token ≈ 3 characters for mixed JSON-ish text.
         """
-        context_str = json.dumps(context)
-        return len(context_str) // 4
+        # Walking the structure just counts characters; serializing it first
+        # allocated a full JSON string only to measure its length
+        return self._approx_char_size(context) // 3
 
 
 # Global instance
@@ -2,19 +2,29 @@
 Conversation Manager for Resume Editing System
 Handles persistent chat history and context window management
 """
-from typing import List, Dict, Any, Optional
-import json
+from typing import Callable, List, Dict, Any, Optional
+import asyncio
+import orjson
+import re
+import time
 import uuid
+from uuid6 import uuid7
 from datetime import datetime, timedelta
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from ..database.connection import SessionLocal
-from ..database.models import ChatConversationTable
+from sqlalchemy import case, cast, func, insert
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from ..database.connection import SessionLocal, ReadSessionLocal
+from ..database.models import ChatConversationTable, ChatSessionTable
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Entries kept per session blob. Must comfortably exceed the context
+# window maximum plus one reset span (max_window + min_window) so
+# get_context_window never has to reach past the trimmed tail.
+_SESSION_BLOB_MAX = 64
+
 
 class ConversationManager:
     """
@@ -25,6 +35,21 @@ class ConversationManager:
         self.max_context_length = max_context_length
         self.max_conversation_length = max_conversation_length
         self.conversation_summary_threshold = 30  # messages
+        # Per-session anchor for the append-only context window; see
+        # get_context_window for why the window must not slide every turn.
+        # When the window resets, the dropped messages are folded into a
+        # running summary instead of being lost.
+        self._window_starts: Dict[str, int] = {}
+        self._window_summaries: Dict[str, str] = {}
+        # Last OpenAI response id per session, enabling server-side
+        # conversation state (previous_response_id) instead of re-sending
+        # the whole history every turn
+        self._last_response_ids: Dict[str, str] = {}
+        # Active session per user as (session_id, last_seen monotonic time);
+        # a fresh entry answers get_session_id without the ORDER BY ...
+        # LIMIT 1 query that otherwise runs before every message save
+        self._session_cache: Dict[str, tuple] = {}
+        self._session_cache_ttl = 1800.0  # seconds
     
     async def save_message(
         self, 
@@ -47,28 +72,126 @@ class ConversationManager:
         try:
             if not session_id:
                 session_id = self._get_or_create_session_id(user_id)
-            
-            with SessionLocal() as db:
-                conversation = ChatConversationTable(
-                    id=str(uuid.uuid4()),
-                    user_id=user_id,
-                    session_id=session_id,
-                    message_type=message_type,
-                    content=message,
-                    message_metadata=json.dumps(metadata) if metadata else None,
-                    created_at=datetime.utcnow()
-                )
-                
-                db.add(conversation)
-                db.commit()
-                
-                logger.info(f"Saved {message_type} message for user {user_id}")
-                return True
-                
+
+            # SQLAlchemy I/O is synchronous; run it in a worker thread so the
+            # event loop keeps serving other requests during the commit
+            def _sync_save() -> None:
+                with SessionLocal() as db:
+                    conversation = ChatConversationTable(
+                        id=uuid7(),
+                        user_id=user_id,
+                        session_id=session_id,
+                        message_type=message_type,
+                        content=message,
+                        message_metadata=metadata if metadata else None,
+                        created_at=datetime.utcnow()
+                    )
+
+                    db.add(conversation)
+                    self._append_session_blob(
+                        db, user_id, session_id,
+                        [{"t": message_type, "c": message}]
+                    )
+                    db.commit()
+
+            await asyncio.to_thread(_sync_save)
+            # %-style defers formatting; DEBUG keeps the per-message insert
+            # path quiet under production log levels
+            logger.debug("Saved %s message for user %s", message_type, user_id)
+            return True
+
         except Exception as e:
             logger.error(f"Failed to save message: {str(e)}")
             return False
     
+    async def save_messages_bulk(
+        self,
+        user_id: str,
+        messages: List[Dict[str, Any]],
+        session_id: Optional[str] = None
+    ) -> bool:
+        """
+        Save several messages in one INSERT ... VALUES statement.
+
+        Each item needs 'message' and 'message_type' keys and may carry
+        'metadata'. A chat turn writes the human and AI message together, so
+        this halves the round trips of two save_message calls.
+        """
+        if not messages:
+            return True
+
+        try:
+            if not session_id:
+                session_id = self._get_or_create_session_id(user_id)
+
+            now = datetime.utcnow()
+            rows = [
+                {
+                    "id": uuid7(),
+                    "user_id": user_id,
+                    "session_id": session_id,
+                    "message_type": msg["message_type"],
+                    "content": msg["message"],
+                    "message_metadata": msg.get("metadata"),
+                    "created_at": now
+                }
+                for msg in messages
+            ]
+
+            def _sync_save() -> None:
+                with SessionLocal() as db:
+                    db.execute(insert(ChatConversationTable), rows)
+                    self._append_session_blob(
+                        db, user_id, session_id,
+                        [{"t": msg["message_type"], "c": msg["message"]} for msg in messages]
+                    )
+                    db.commit()
+
+            # Keep the event loop free during the insert round trip
+            await asyncio.to_thread(_sync_save)
+            logger.debug("Saved %d messages for user %s", len(rows), user_id)
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save messages in bulk: {str(e)}")
+            return False
+
+    @staticmethod
+    def _append_session_blob(db: Session, user_id: str, session_id: str, entries: List[Dict[str, str]]) -> None:
+        """
+        Upsert-append turn entries to the session's JSONB message blob.
+        Runs inside the caller's transaction, so blob and audit rows commit
+        together. The blob is trimmed to its last _SESSION_BLOB_MAX entries
+        in the same statement, so it never grows past the window the hot
+        read path needs; message_count keeps the lifetime total the window
+        anchor math runs on.
+        """
+        now = datetime.utcnow()
+        combined = ChatSessionTable.messages.op("||")(cast(entries, JSONB))
+        stmt = pg_insert(ChatSessionTable).values(
+            session_id=session_id,
+            user_id=user_id,
+            messages=entries,
+            message_count=len(entries),
+            updated_at=now
+        ).on_conflict_do_update(
+            index_elements=[ChatSessionTable.session_id],
+            set_={
+                "messages": case(
+                    (
+                        func.jsonb_array_length(combined) > _SESSION_BLOB_MAX,
+                        func.jsonb_path_query_array(
+                            combined, f"$[last - {_SESSION_BLOB_MAX - 1} to last]"
+                        ),
+                    ),
+                    else_=combined,
+                ),
+                "message_count": ChatSessionTable.message_count + len(entries),
+                "updated_at": now,
+            },
+        )
+        db.execute(stmt)
+
     def get_conversation_context(
         self, 
         user_id: str, 
@@ -80,57 +203,290 @@ class ConversationManager:
         Handles context window management and compression.
         """
         try:
-            with SessionLocal() as db:
-                query = db.query(ChatConversationTable).filter(
-                    ChatConversationTable.user_id == user_id
-                )
-                
+            with ReadSessionLocal() as db:
+                # Session-scoped reads come from the JSONB blob: one row,
+                # no ORDER BY, no per-message hydration
                 if session_id:
-                    query = query.filter(ChatConversationTable.session_id == session_id)
-                
-                # Get recent messages
-                messages_data = query.order_by(
+                    row = db.query(
+                        ChatSessionTable.message_count, ChatSessionTable.messages
+                    ).filter(
+                        ChatSessionTable.session_id == session_id,
+                        ChatSessionTable.user_id == user_id
+                    ).first()
+                    if row is not None and row.messages:
+                        return self._blob_to_messages(row.messages, limit, total=row.message_count)
+
+                # Phase one fetches only ids, types and content lengths - a
+                # tiny payload - so the token budget is decided before any
+                # message body crosses the wire
+                meta_query = db.query(
+                    ChatConversationTable.id,
+                    ChatConversationTable.message_type,
+                    func.length(ChatConversationTable.content)
+                ).filter(ChatConversationTable.user_id == user_id)
+
+                if session_id:
+                    meta_query = meta_query.filter(ChatConversationTable.session_id == session_id)
+
+                meta = meta_query.order_by(
                     ChatConversationTable.created_at.desc()
                 ).limit(limit or self.max_conversation_length).all()
-                
-                # Convert to LangChain messages (reverse to chronological order)
-                messages = []
-                for msg_data in reversed(messages_data):
-                    if msg_data.message_type == "human":
-                        messages.append(HumanMessage(content=msg_data.content))
-                    elif msg_data.message_type == "ai":
-                        messages.append(AIMessage(content=msg_data.content))
-                
-                # Check if context is too long and compress if needed
-                if self._estimate_token_count(messages) > self.max_context_length:
-                    messages = self._compress_conversation(messages)
-                
-                logger.info(f"Retrieved {len(messages)} messages for user {user_id}")
-                return messages
-                
+
+                # Walk newest-first, keeping messages until the budget is spent
+                budget_chars = self.max_context_length * 3
+                kept_ids = []
+                dropped = 0
+                used_chars = 0
+                for row_id, message_type, content_len in meta:
+                    if message_type not in ("human", "ai"):
+                        continue
+                    if dropped or used_chars + (content_len or 0) > budget_chars:
+                        dropped += 1
+                        continue
+                    used_chars += content_len or 0
+                    kept_ids.append(row_id)
+
+                if not kept_ids:
+                    return []
+
+                # Phase two fetches content only for the survivors, already in
+                # chronological order - no reversed() pass, and selecting the
+                # two columns skips ORM object hydration for rows that are
+                # immediately repackaged as LangChain messages
+                rows = db.query(
+                    ChatConversationTable.message_type,
+                    ChatConversationTable.content
+                ).filter(
+                    ChatConversationTable.id.in_(kept_ids)
+                ).order_by(ChatConversationTable.created_at.asc()).all()
+
+            messages: List[BaseMessage] = []
+            if dropped:
+                messages.append(AIMessage(
+                    content=f"[Previous conversation: {dropped} earlier messages trimmed to fit the context budget]"
+                ))
+            for msg_data in rows:
+                if msg_data.message_type == "human":
+                    messages.append(HumanMessage(content=msg_data.content))
+                else:
+                    messages.append(AIMessage(content=msg_data.content))
+
+            logger.info("Retrieved %d messages for user %s", len(messages), user_id)
+            return messages
+
         except Exception as e:
             logger.error(f"Failed to get conversation context: {str(e)}")
             return []
     
+    def get_context_window(
+        self,
+        user_id: str,
+        session_id: str,
+        min_window: int = 10,
+        max_window: int = 20
+    ) -> List[BaseMessage]:
+        """
+        Get session history as an append-only expanding window.
+
+        A fixed "last N messages" slice shifts by one every turn, which
+        invalidates provider-side prompt-prefix caching on the whole history
+        block. Anchoring the window start per session means consecutive turns
+        only differ by the newly appended messages, so the prefix stays
+        byte-identical and caches. The window grows from min_window up to
+        max_window, then resets to the most recent min_window messages;
+        messages falling out of the window are compressed into a running
+        summary prepended to the result, so long sessions keep their context
+        instead of being hard-truncated.
+
+        The hot path is a single-row read of the session's JSONB blob; only
+        sessions that predate the blob table fall back to querying the
+        per-message audit rows.
+        """
+        try:
+            with ReadSessionLocal() as db:
+                row = db.query(
+                    ChatSessionTable.message_count, ChatSessionTable.messages
+                ).filter(
+                    ChatSessionTable.session_id == session_id,
+                    ChatSessionTable.user_id == user_id
+                ).first()
+
+                if row is not None and row.messages:
+                    entries = [e for e in row.messages if e.get("t") in ("human", "ai")]
+                    total = row.message_count
+                    # Absolute position of the first entry still in the
+                    # (trimmed) blob; the anchor never reaches before it
+                    # because _SESSION_BLOB_MAX exceeds the window span
+                    offset = total - len(entries)
+
+                    def fetch(start: int, stop: Optional[int]) -> List[BaseMessage]:
+                        lo = max(0, start - offset)
+                        hi = None if stop is None else max(0, stop - offset)
+                        return self._entries_to_messages(entries[lo:hi])
+
+                    return self._apply_window(session_id, total, min_window, max_window, fetch)
+
+                # Column tuples, not ORM entities - the rows only feed
+                # _rows_to_messages
+                base = db.query(
+                    ChatConversationTable.message_type,
+                    ChatConversationTable.content
+                ).filter(
+                    ChatConversationTable.user_id == user_id,
+                    ChatConversationTable.session_id == session_id,
+                    ChatConversationTable.message_type.in_(("human", "ai"))
+                )
+                total = base.count()
+                ordered = base.order_by(ChatConversationTable.created_at.asc())
+
+                def fetch(start: int, stop: Optional[int]) -> List[BaseMessage]:
+                    query = ordered.offset(start)
+                    if stop is not None:
+                        query = query.limit(stop - start)
+                    return self._rows_to_messages(query.all())
+
+                return self._apply_window(session_id, total, min_window, max_window, fetch)
+
+        except Exception as e:
+            logger.error(f"Failed to get context window: {str(e)}")
+            return []
+
+    def _apply_window(
+        self,
+        session_id: str,
+        total: int,
+        min_window: int,
+        max_window: int,
+        fetch: Callable[[int, Optional[int]], List[BaseMessage]]
+    ) -> List[BaseMessage]:
+        """
+        Apply the per-session append-only window over a conversation of
+        `total` messages. `fetch(start, stop)` returns the messages in
+        [start, stop) by absolute position, stop=None meaning to the end.
+        """
+        anchor = self._window_starts.get(session_id)
+        if anchor is None:
+            anchor = max(0, total - min_window)
+            self._window_starts[session_id] = anchor
+        elif total - anchor > max_window:
+            # Window reset: fold the dropped messages (and any prior
+            # summary) into the running session summary
+            new_anchor = max(0, total - min_window)
+            dropped = fetch(anchor, new_anchor)
+            prior_summary = self._window_summaries.get(session_id)
+            if prior_summary:
+                dropped.insert(0, AIMessage(content=prior_summary))
+            self._window_summaries[session_id] = self._summarize_conversation(dropped)
+            anchor = new_anchor
+            self._window_starts[session_id] = anchor
+
+        messages = fetch(anchor, None)
+
+        summary = self._window_summaries.get(session_id)
+        if summary:
+            messages.insert(0, AIMessage(
+                content=f"[Previous conversation summary: {summary}]"
+            ))
+
+        return messages
+
+    def _blob_to_messages(
+        self,
+        blob: List[Dict[str, str]],
+        limit: Optional[int] = None,
+        total: Optional[int] = None
+    ) -> List[BaseMessage]:
+        """
+        Convert a session blob to messages under the same token budget.
+        `total` is the session's lifetime message count, so the trim marker
+        also accounts for entries already aged out of the blob.
+        """
+        recent = blob[-(limit or self.max_conversation_length):]
+        budget_chars = self.max_context_length * 3
+        used_chars = 0
+        picked = []
+        for entry in reversed(recent):
+            if entry.get("t") not in ("human", "ai"):
+                continue
+            content = entry.get("c", "")
+            if picked and used_chars + len(content) > budget_chars:
+                break
+            used_chars += len(content)
+            picked.append(entry)
+        dropped = (total if total is not None else len(blob)) - len(picked)
+
+        messages: List[BaseMessage] = []
+        if dropped > 0:
+            messages.append(AIMessage(
+                content=f"[Previous conversation: {dropped} earlier messages trimmed to fit the context budget]"
+            ))
+        for entry in reversed(picked):
+            if entry["t"] == "human":
+                messages.append(HumanMessage(content=entry["c"]))
+            else:
+                messages.append(AIMessage(content=entry["c"]))
+        return messages
+
+    @staticmethod
+    def _entries_to_messages(entries: List[Dict[str, str]]) -> List[BaseMessage]:
+        """Convert blob entries to LangChain messages"""
+        messages: List[BaseMessage] = []
+        for entry in entries:
+            if entry["t"] == "human":
+                messages.append(HumanMessage(content=entry["c"]))
+            else:
+                messages.append(AIMessage(content=entry["c"]))
+        return messages
+
+    @staticmethod
+    def _rows_to_messages(rows) -> List[BaseMessage]:
+        """Convert chat rows to LangChain messages"""
+        messages: List[BaseMessage] = []
+        for msg_data in rows:
+            if msg_data.message_type == "human":
+                messages.append(HumanMessage(content=msg_data.content))
+            elif msg_data.message_type == "ai":
+                messages.append(AIMessage(content=msg_data.content))
+        return messages
+
+    def get_last_response_id(self, session_id: str) -> Optional[str]:
+        """Last OpenAI response id for a session, if one is being chained"""
+        return self._last_response_ids.get(session_id)
+
+    def set_last_response_id(self, session_id: str, response_id: Optional[str]) -> None:
+        """Record (or clear, with None) the session's chained response id"""
+        if response_id:
+            self._last_response_ids[session_id] = response_id
+        else:
+            self._last_response_ids.pop(session_id, None)
+
     def get_session_id(self, user_id: str) -> str:
         """
         Get or create a session ID for a user.
         Returns existing session if available, otherwise creates a new one.
         """
         try:
-            with SessionLocal() as db:
+            # A recently used session answers from the cache - no DB read
+            cached = self._session_cache.get(user_id)
+            if cached and time.monotonic() - cached[1] < self._session_cache_ttl:
+                self._session_cache[user_id] = (cached[0], time.monotonic())
+                return cached[0]
+
+            with ReadSessionLocal() as db:
                 # Get the most recent message for this user
                 recent_message = db.query(ChatConversationTable).filter(
                     ChatConversationTable.user_id == user_id
                 ).order_by(ChatConversationTable.created_at.desc()).first()
-                
+
                 if recent_message:
+                    self._session_cache[user_id] = (recent_message.session_id, time.monotonic())
                     return recent_message.session_id
-                
+
                 # Create new session with UUID to ensure uniqueness
                 unique_id = str(uuid.uuid4())[:8]
                 new_session_id = f"session_{user_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{unique_id}"
-                logger.info(f"Created new session {new_session_id} for user {user_id}")
+                self._session_cache[user_id] = (new_session_id, time.monotonic())
+                logger.info("Created new session %s for user %s", new_session_id, user_id)
                 return new_session_id
                 
         except Exception as e:
@@ -146,6 +502,9 @@ class ConversationManager:
         try:
             unique_id = str(uuid.uuid4())[:8]
             new_session_id = f"session_{user_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{unique_id}"
+            # Point the cache at the fresh session so subsequent saves and
+            # lookups land in it without a DB read
+            self._session_cache[user_id] = (new_session_id, time.monotonic())
             logger.info(f"Created new session {new_session_id} for user {user_id}")
             return new_session_id
         except Exception as e:
@@ -185,37 +544,45 @@ class ConversationManager:
             logger.error(f"Failed to compress conversation: {str(e)}")
             return messages[-20:]  # Fallback: just keep last 20 messages
     
+    # One compiled alternation replaces eleven substring scans per message;
+    # the map translates each hit into its topic or action label
+    _SUMMARY_PATTERN = re.compile(
+        r"experience|work|education|skills|summary|update|edit|change|add|create|help",
+        re.IGNORECASE
+    )
+    _SUMMARY_KEYWORD_MAP = {
+        "experience": ("topic", "work experience"),
+        "work": ("topic", "work experience"),
+        "education": ("topic", "education"),
+        "skills": ("topic", "skills"),
+        "summary": ("topic", "professional summary"),
+        "update": ("action", "editing"),
+        "edit": ("action", "editing"),
+        "change": ("action", "editing"),
+        "add": ("action", "adding content"),
+        "create": ("action", "adding content"),
+        "help": ("action", "seeking advice"),
+    }
+
     def _summarize_conversation(self, messages: List[BaseMessage]) -> str:
         """
         Create a summary of conversation messages.
         Simple keyword-based summary for now.
         """
         try:
-            # Extract key topics and actions from messages
+            # Extract key topics and actions with one C-level regex pass per
+            # message instead of lowercasing and scanning per keyword
             topics = set()
             actions = set()
-            
+
             for message in messages:
-                content = message.content.lower()
-                
-                # Look for resume sections
-                if "experience" in content or "work" in content:
-                    topics.add("work experience")
-                if "education" in content:
-                    topics.add("education")
-                if "skills" in content:
-                    topics.add("skills")
-                if "summary" in content:
-                    topics.add("professional summary")
-                
-                # Look for actions
-                if any(word in content for word in ["update", "edit", "change"]):
-                    actions.add("editing")
-                if any(word in content for word in ["add", "create"]):
-                    actions.add("adding content")
-                if "help" in content:
-                    actions.add("seeking advice")
-            
+                for hit in self._SUMMARY_PATTERN.findall(message.content):
+                    bucket, label = self._SUMMARY_KEYWORD_MAP[hit.lower()]
+                    if bucket == "topic":
+                        topics.add(label)
+                    else:
+                        actions.add(label)
+
             # Build summary
             summary_parts = []
             if topics:
@@ -235,10 +602,10 @@ class ConversationManager:
     def _estimate_token_count(self, messages: List[BaseMessage]) -> int:
         """
         Rough estimation of token count for messages.
-        Rule of thumb: 1 token ≈ 4 characters for English text.
+        Rule of thumb: 1 token ≈ 3 characters for conversational text.
         """
         total_chars = sum(len(msg.content) for msg in messages)
-        return total_chars // 4
+        return total_chars // 3
     
     def clear_old_conversations(self, days_old: int = 30) -> int:
         """
@@ -252,17 +619,36 @@ class ConversationManager:
         """
         try:
             cutoff_date = datetime.utcnow() - timedelta(days=days_old)
-            
+            chunk_size = 10000
+            deleted_count = 0
+
+            # Delete in chunks with one commit each: synchronize_session=False
+            # skips pulling matching PKs into the session, and the bounded
+            # subquery keeps lock duration and WAL volume at O(chunk)
             with SessionLocal() as db:
-                deleted_count = db.query(ChatConversationTable).filter(
-                    ChatConversationTable.created_at < cutoff_date
-                ).delete()
-                
+                while True:
+                    chunk_ids = db.query(ChatConversationTable.id).filter(
+                        ChatConversationTable.created_at < cutoff_date
+                    ).limit(chunk_size).subquery()
+
+                    deleted = db.query(ChatConversationTable).filter(
+                        ChatConversationTable.id.in_(db.query(chunk_ids.c.id))
+                    ).delete(synchronize_session=False)
+                    db.commit()
+
+                    deleted_count += deleted
+                    if deleted < chunk_size:
+                        break
+
+                # Session blobs age out alongside their audit rows
+                db.query(ChatSessionTable).filter(
+                    ChatSessionTable.updated_at < cutoff_date
+                ).delete(synchronize_session=False)
                 db.commit()
-                
-                logger.info(f"Deleted {deleted_count} old conversations")
-                return deleted_count
-                
+
+            logger.info(f"Deleted {deleted_count} old conversations")
+            return deleted_count
+
         except Exception as e:
             logger.error(f"Failed to clear old conversations: {str(e)}")
             return 0
@@ -279,35 +665,54 @@ class ConversationManager:
             List of session data with metadata
         """
         try:
-            with SessionLocal() as db:
-                # Get session details with message counts and last activity
-                session_details = db.query(
+            with ReadSessionLocal() as db:
+                # Per-session counts and activity bounds
+                stats = db.query(
                     ChatConversationTable.session_id,
                     func.count(ChatConversationTable.id).label('message_count'),
                     func.min(ChatConversationTable.created_at).label('created_at'),
-                    func.max(ChatConversationTable.created_at).label('last_activity'),
-                    ChatConversationTable.content.label('first_message_content')
+                    func.max(ChatConversationTable.created_at).label('last_activity')
                 ).filter(
                     ChatConversationTable.user_id == user_id
                 ).group_by(ChatConversationTable.session_id).order_by(
                     func.max(ChatConversationTable.created_at).desc()
-                ).limit(limit).all()
-                
+                ).limit(limit).subquery()
+
+                # First human message per session, ranked by a window function
+                ranked = db.query(
+                    ChatConversationTable.session_id,
+                    ChatConversationTable.content,
+                    func.row_number().over(
+                        partition_by=ChatConversationTable.session_id,
+                        order_by=ChatConversationTable.created_at.asc()
+                    ).label('rn')
+                ).filter(
+                    ChatConversationTable.user_id == user_id,
+                    ChatConversationTable.message_type == 'human'
+                ).subquery()
+
+                # One round trip: join the aggregates with each session's
+                # first human message instead of a follow-up batched query
+                session_details = db.query(
+                    stats.c.session_id,
+                    stats.c.message_count,
+                    stats.c.created_at,
+                    stats.c.last_activity,
+                    ranked.c.content.label('first_human_content')
+                ).outerjoin(
+                    ranked,
+                    (ranked.c.session_id == stats.c.session_id) & (ranked.c.rn == 1)
+                ).order_by(stats.c.last_activity.desc()).all()
+
                 sessions = []
                 for session in session_details:
-                    # Get the first human message for session title
-                    first_human_message = db.query(ChatConversationTable).filter(
-                        ChatConversationTable.user_id == user_id,
-                        ChatConversationTable.session_id == session.session_id,
-                        ChatConversationTable.message_type == 'human'
-                    ).order_by(ChatConversationTable.created_at.asc()).first()
-                    
                     # Create a session title from first message or timestamp
-                    if first_human_message:
-                        title = first_human_message.content[:50] + ("..." if len(first_human_message.content) > 50 else "")
+                    first_human_content = session.first_human_content
+                    if first_human_content:
+                        title = first_human_content[:50] + ("..." if len(first_human_content) > 50 else "")
                     else:
                         title = f"Chat Session {session.created_at.strftime('%m/%d %H:%M')}"
-                    
+
                     sessions.append({
                         "session_id": session.session_id,
                         "title": title,
@@ -337,18 +742,18 @@ class ConversationManager:
             List of messages in chronological order
         """
         try:
-            with SessionLocal() as db:
+            with ReadSessionLocal() as db:
                 messages = db.query(ChatConversationTable).filter(
                     ChatConversationTable.user_id == user_id,
                     ChatConversationTable.session_id == session_id
                 ).order_by(ChatConversationTable.created_at.asc()).limit(limit).all()
                 
                 return [{
-                    "id": msg.id,
+                    "id": str(msg.id),
                     "type": msg.message_type,
                     "message": msg.content,
                     "timestamp": msg.created_at.isoformat(),
-                    "metadata": json.loads(msg.message_metadata) if msg.message_metadata else None
+                    "metadata": orjson.loads(msg.message_metadata) if isinstance(msg.message_metadata, str) else msg.message_metadata
                 } for msg in messages]
                 
         except Exception as e:
@@ -372,10 +777,20 @@ class ConversationManager:
                     ChatConversationTable.user_id == user_id,
                     ChatConversationTable.session_id == session_id
                 ).delete()
-                
+
+                # Remove the hot-path blob alongside the audit rows
+                db.query(ChatSessionTable).filter(
+                    ChatSessionTable.session_id == session_id,
+                    ChatSessionTable.user_id == user_id
+                ).delete()
+
                 db.commit()
                 
                 if deleted_count > 0:
+                    # Drop the cached active session if it was the one deleted
+                    cached = self._session_cache.get(user_id)
+                    if cached and cached[0] == session_id:
+                        del self._session_cache[user_id]
                     logger.info(f"Deleted session {session_id} with {deleted_count} messages for user {user_id}")
                     return True
                 else:
@@ -409,29 +824,24 @@ class ConversationManager:
         Get conversation statistics for a user.
         """
         try:
-            with SessionLocal() as db:
-                total_messages = db.query(ChatConversationTable).filter(
-                    ChatConversationTable.user_id == user_id
-                ).count()
-                
-                total_sessions = db.query(ChatConversationTable.session_id).filter(
-                    ChatConversationTable.user_id == user_id
-                ).distinct().count()
-                
-                recent_messages = db.query(ChatConversationTable).filter(
-                    ChatConversationTable.user_id == user_id,
-                    ChatConversationTable.created_at > datetime.utcnow() - timedelta(days=7)
-                ).count()
-                
-                last_activity = db.query(ChatConversationTable).filter(
+            cutoff = datetime.utcnow() - timedelta(days=7)
+            with ReadSessionLocal() as db:
+                # One aggregate pass over the user's rows instead of four
+                # separate round trips
+                total_messages, total_sessions, recent_messages, last_activity = db.query(
+                    func.count(ChatConversationTable.id),
+                    func.count(func.distinct(ChatConversationTable.session_id)),
+                    func.sum(case((ChatConversationTable.created_at > cutoff, 1), else_=0)),
+                    func.max(ChatConversationTable.created_at)
+                ).filter(
                     ChatConversationTable.user_id == user_id
-                ).order_by(ChatConversationTable.created_at.desc()).first()
-                
+                ).one()
+
                 return {
-                    "total_messages": total_messages,
-                    "total_sessions": total_sessions,
-                    "recent_messages_7days": recent_messages,
-                    "last_activity": last_activity.created_at.isoformat() if last_activity else None
+                    "total_messages": total_messages or 0,
+                    "total_sessions": total_sessions or 0,
+                    "recent_messages_7days": int(recent_messages or 0),
+                    "last_activity": last_activity.isoformat() if last_activity else None
                 }
                 
         except Exception as e:
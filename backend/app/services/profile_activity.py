@@ -0,0 +1,106 @@
+"""
+Profile Activity Tracker
+Coalesces per-request last_active / view-count writes into periodic batched updates
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import case, update
+from ..database.connection import AsyncSessionLocal
+from ..database.models import ProfileTable
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileActivityTracker:
+    """
+    Buffers profile activity touches in-process and flushes them in batches.
+
+    Read endpoints used to issue an UPDATE + COMMIT per request just to bump
+    last_active, doubling DB round-trips. Touches are queued here instead and
+    a background loop coalesces them (one row per profile, newest timestamp,
+    summed view counts) into a single UPDATE every flush interval.
+    """
+
+    def __init__(self, flush_interval: float = 5.0, max_batch_size: int = 1000):
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def touch(self, profile_id: str) -> None:
+        """Record activity for a profile without hitting the database"""
+        self._queue.put_nowait((profile_id, datetime.utcnow(), 0))
+
+    def record_view(self, profile_id: str) -> None:
+        """Record a profile view (activity + view-count increment)"""
+        self._queue.put_nowait((profile_id, datetime.utcnow(), 1))
+
+    def start(self) -> None:
+        """Start the background flush loop (call from app startup)"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.flush_loop())
+            logger.info("Started profile activity flush loop")
+
+    async def stop(self) -> None:
+        """Stop the flush loop and flush any remaining touches"""
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
+    async def flush_loop(self) -> None:
+        """Periodically flush queued touches to the database"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush profile activity: {str(e)}")
+
+    async def flush(self) -> int:
+        """
+        Drain the queue, deduplicate by profile, and apply one batched UPDATE.
+
+        Returns the number of profiles updated.
+        """
+        last_active = {}
+        view_counts = {}
+
+        for _ in range(self.max_batch_size):
+            try:
+                profile_id, timestamp, views = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+
+            if profile_id not in last_active or timestamp > last_active[profile_id]:
+                last_active[profile_id] = timestamp
+            if views:
+                view_counts[profile_id] = view_counts.get(profile_id, 0) + views
+
+        if not last_active:
+            return 0
+
+        profile_ids = list(last_active.keys())
+        values = {
+            "last_active": case(last_active, value=ProfileTable.id)
+        }
+        if view_counts:
+            values["profile_views"] = ProfileTable.profile_views + case(
+                view_counts, value=ProfileTable.id, else_=0
+            )
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(ProfileTable).where(ProfileTable.id.in_(profile_ids)).values(**values)
+            )
+            await db.commit()
+
+        logger.info(f"Flushed activity for {len(profile_ids)} profiles")
+        return len(profile_ids)
+
+
+# Global instance
+profile_activity = ProfileActivityTracker()
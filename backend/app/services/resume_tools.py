@@ -15,6 +15,21 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _parse_json_column(value: Any, default: Any) -> Any:
+    """
+    Return a JSONB column value as Python data.
+    Tolerates legacy rows that still hold a JSON string.
+    """
+    if value is None:
+        return default
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return default
+    return value
+
+
 class ResumeEditingTools:
     """
     Collection of tools for resume editing operations.
@@ -65,11 +80,11 @@ class ResumeEditingTools:
                 elif section_name.lower() == "summary":
                     section_data = resume.summary
                 elif section_name.lower() == "experience":
-                    section_data = json.loads(resume.experience) if resume.experience else []
+                    section_data = _parse_json_column(resume.experience, [])
                 elif section_name.lower() == "education":
-                    section_data = json.loads(resume.education) if resume.education else []
+                    section_data = _parse_json_column(resume.education, [])
                 elif section_name.lower() == "skills":
-                    section_data = json.loads(resume.skills) if resume.skills else []
+                    section_data = _parse_json_column(resume.skills, [])
                 else:
                     return {
                         "success": False,
@@ -176,8 +191,9 @@ class ResumeEditingTools:
                         "preview": None
                     }
                 
-                # Get current experience data
-                current_experience = json.loads(resume.experience) if resume.experience else []
+                # Get current experience data (copy so mutations don't alias
+                # the ORM-tracked JSONB value)
+                current_experience = list(_parse_json_column(resume.experience, []))
                 original_experience = current_experience.copy()
                 
                 # Perform the requested action
@@ -246,7 +262,7 @@ class ResumeEditingTools:
                 }
                 
                 # Save changes
-                resume.experience = json.dumps(current_experience)
+                resume.experience = current_experience
                 resume.updated_at = datetime.utcnow()
                 db.commit()
                 
@@ -358,15 +374,16 @@ class ResumeEditingTools:
                     }
                 
                 # Get current skills
-                current_skills_raw = json.loads(resume.skills) if resume.skills else {}
+                current_skills_raw = _parse_json_column(resume.skills, {})
                 original_skills = current_skills_raw.copy() if isinstance(current_skills_raw, dict) else current_skills_raw[:]
                 
-                # Ensure we have a proper skills structure
+                # Ensure we have a proper skills structure (copying nested
+                # lists so mutations don't alias the ORM-tracked JSONB value)
                 if isinstance(current_skills_raw, list):
                     # Convert old flat list format to categorized format
-                    current_skills = {"technical": current_skills_raw, "soft": []}
+                    current_skills = {"technical": list(current_skills_raw), "soft": []}
                 elif isinstance(current_skills_raw, dict):
-                    current_skills = current_skills_raw
+                    current_skills = {category: list(skills) for category, skills in current_skills_raw.items()}
                 else:
                     current_skills = {"technical": [], "soft": []}
                 
@@ -422,7 +439,7 @@ class ResumeEditingTools:
                     }
                 
                 # Update resume
-                resume.skills = json.dumps(current_skills)
+                resume.skills = current_skills
                 resume.updated_at = datetime.utcnow()
                 db.commit()
                 
@@ -491,7 +508,7 @@ class ResumeEditingTools:
                 # Search in experience
                 if resume.experience:
                     try:
-                        experience_data = json.loads(resume.experience)
+                        experience_data = _parse_json_column(resume.experience, [])
                         for i, exp in enumerate(experience_data):
                             if any(query_lower in str(value).lower() for value in exp.values()):
                                 matches.append({
@@ -506,7 +523,7 @@ class ResumeEditingTools:
                 # Search in skills
                 if resume.skills:
                     try:
-                        skills_data = json.loads(resume.skills)
+                        skills_data = _parse_json_column(resume.skills, [])
                         matching_skills = [skill for skill in skills_data if query_lower in skill.lower()]
                         if matching_skills:
                             matches.append({
@@ -564,16 +581,16 @@ class ResumeVersionManager:
                 
                 # Create version record
                 version = ResumeVersionTable(
-                    id=str(uuid.uuid4()),
+                    id=uuid.uuid4(),
                     user_id=user_id,
                     resume_id=resume_id,
                     version_number=next_version,
-                    content=json.dumps({
+                    content={
                         "summary": resume.summary,
                         "experience": resume.experience,
                         "education": resume.education,
                         "skills": resume.skills
-                    }),
+                    },
                     changes_summary=f"{section_changed}: {change_summary}",
                     created_by="ai",
                     created_at=datetime.utcnow()
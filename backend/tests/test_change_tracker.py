@@ -0,0 +1,168 @@
+"""
+Tests for Change Tracker - Resume Change Detection
+"""
+import pytest
+
+from app.services.change_tracker import ChangeTracker, ChangeType
+
+
+def make_resume():
+    """A small but representative resume payload"""
+    return {
+        "personalInfo": {"name": "John Doe", "email": "john@example.com"},
+        "summary": "Experienced software engineer",
+        "experience": [
+            {"company": "Acme Corp", "title": "Engineer"},
+            {"company": "Globex", "title": "Developer"},
+        ],
+        "education": [{"school": "State University", "degree": "BSc"}],
+        "skills": {"technical": ["Python", "SQL"], "soft": ["Communication"]},
+    }
+
+
+class TestDetectChanges:
+    """Test the structured diff walk behind change tracking"""
+
+    def setup_method(self):
+        self.tracker = ChangeTracker()
+
+    def test_no_changes_for_identical_resumes(self):
+        resume = make_resume()
+        changes = self.tracker._detect_changes(resume, make_resume())
+        assert changes == []
+
+    def test_summary_change(self):
+        old = make_resume()
+        new = make_resume()
+        new["summary"] = "Seasoned software engineer and team lead"
+
+        changes = self.tracker._detect_changes(old, new)
+
+        assert len(changes) == 1
+        change = changes[0]
+        assert change["type"] == ChangeType.SUMMARY
+        assert change["old_value"] == old["summary"]
+        assert change["new_value"] == new["summary"]
+        assert change["metadata"]["char_diff"] == len(new["summary"]) - len(old["summary"])
+
+    def test_summary_added(self):
+        """A top-level key appearing for the first time is still classified"""
+        old = make_resume()
+        del old["summary"]
+        new = make_resume()
+
+        changes = self.tracker._detect_changes(old, new)
+
+        assert len(changes) == 1
+        assert changes[0]["type"] == ChangeType.SUMMARY
+        assert changes[0]["old_value"] is None
+        assert changes[0]["new_value"] == new["summary"]
+
+    def test_personal_info_change(self):
+        old = make_resume()
+        new = make_resume()
+        new["personalInfo"]["name"] = "Jane Doe"
+
+        changes = self.tracker._detect_changes(old, new)
+
+        assert len(changes) == 1
+        change = changes[0]
+        assert change["type"] == ChangeType.PERSONAL_INFO
+        assert change["metadata"]["field"] == "name"
+        assert change["old_value"] == "John Doe"
+        assert change["new_value"] == "Jane Doe"
+
+    def test_experience_add(self):
+        old = make_resume()
+        new = make_resume()
+        new_entry = {"company": "Initech", "title": "Architect"}
+        new["experience"].append(new_entry)
+
+        changes = self.tracker._detect_changes(old, new)
+
+        assert len(changes) == 1
+        change = changes[0]
+        assert change["type"] == ChangeType.EXPERIENCE_ADD
+        assert change["old_value"] is None
+        assert change["new_value"] == new_entry
+
+    def test_experience_edit(self):
+        old = make_resume()
+        new = make_resume()
+        new["experience"][0]["title"] = "Senior Engineer"
+
+        changes = self.tracker._detect_changes(old, new)
+
+        assert len(changes) == 1
+        change = changes[0]
+        assert change["type"] == ChangeType.EXPERIENCE_EDIT
+        assert change["metadata"]["index"] == 0
+        assert change["old_value"] == "Engineer"
+        assert change["new_value"] == "Senior Engineer"
+
+    def test_experience_delete(self):
+        old = make_resume()
+        new = make_resume()
+        removed = new["experience"].pop()
+
+        changes = self.tracker._detect_changes(old, new)
+
+        assert len(changes) == 1
+        change = changes[0]
+        assert change["type"] == ChangeType.EXPERIENCE_DELETE
+        assert change["old_value"] == removed
+        assert change["new_value"] is None
+
+    def test_education_edit(self):
+        old = make_resume()
+        new = make_resume()
+        new["education"][0]["degree"] = "MSc"
+
+        changes = self.tracker._detect_changes(old, new)
+
+        assert len(changes) == 1
+        assert changes[0]["type"] == ChangeType.EDUCATION_EDIT
+
+    def test_skills_add_and_remove(self):
+        old = make_resume()
+        new = make_resume()
+        new["skills"]["technical"] = ["Python", "Rust"]  # SQL out, Rust in
+
+        changes = self.tracker._detect_changes(old, new)
+
+        assert len(changes) == 1
+        change = changes[0]
+        assert change["type"] == ChangeType.SKILLS_EDIT
+        assert change["metadata"]["skill_type"] == "technical"
+        assert change["metadata"]["added"] == ["Rust"]
+        assert change["metadata"]["removed"] == ["SQL"]
+
+    def test_skills_reorder_is_not_a_change(self):
+        """Skills have set semantics: pure reordering is not reported"""
+        old = make_resume()
+        new = make_resume()
+        new["skills"]["technical"] = list(reversed(new["skills"]["technical"]))
+
+        changes = self.tracker._detect_changes(old, new)
+
+        assert changes == []
+
+    def test_multiple_sections_changed(self):
+        old = make_resume()
+        new = make_resume()
+        new["summary"] = "Rewritten summary"
+        new["personalInfo"]["email"] = "jane@example.com"
+        new["experience"].append({"company": "Initech", "title": "Architect"})
+
+        changes = self.tracker._detect_changes(old, new)
+
+        types = {change["type"] for change in changes}
+        assert types == {
+            ChangeType.SUMMARY,
+            ChangeType.PERSONAL_INFO,
+            ChangeType.EXPERIENCE_ADD,
+        }
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
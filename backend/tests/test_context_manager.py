@@ -96,7 +96,7 @@ class TestContextManager:
         assert resume_outline["sections"]["education"]["has_content"] is True
         assert resume_outline["sections"]["skills"]["has_content"] is True
     
-    @patch('app.services.context_manager.SessionLocal')
+    @patch('app.services.context_manager.ReadSessionLocal')
     def test_database_error_handling(self, mock_session_local):
         """Test error handling when database is unavailable"""
         # Mock database error
@@ -0,0 +1,99 @@
+"""
+Tests for Profile Activity Tracker - Batched Activity Flushes
+"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+from app.services.profile_activity import ProfileActivityTracker
+
+
+class TestProfileActivityFlush:
+    """Test queue draining and coalescing in flush()"""
+
+    @pytest.mark.asyncio
+    async def test_flush_empty_queue(self):
+        """An empty queue flushes to nothing without touching the database"""
+        tracker = ProfileActivityTracker()
+
+        with patch('app.services.profile_activity.AsyncSessionLocal') as factory:
+            updated = await tracker.flush()
+
+        assert updated == 0
+        factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flush_coalesces_touches_per_profile(self):
+        """Repeat touches collapse to one row per profile in one UPDATE"""
+        tracker = ProfileActivityTracker()
+        tracker.touch("p1")
+        tracker.touch("p1")
+        tracker.record_view("p1")
+        tracker.record_view("p2")
+
+        with patch('app.services.profile_activity.AsyncSessionLocal') as factory:
+            db = AsyncMock()
+            factory.return_value.__aenter__.return_value = db
+            updated = await tracker.flush()
+
+        assert updated == 2
+        db.execute.assert_awaited_once()
+        db.commit.assert_awaited_once()
+        assert tracker._queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_flush_keeps_newest_timestamp(self):
+        """Coalescing keeps the latest last_active value per profile"""
+        tracker = ProfileActivityTracker()
+        older = datetime(2026, 1, 1, 12, 0)
+        newer = older + timedelta(minutes=5)
+        tracker._queue.put_nowait(("p1", newer, 0))
+        tracker._queue.put_nowait(("p1", older, 0))
+
+        with patch('app.services.profile_activity.AsyncSessionLocal') as factory:
+            db = AsyncMock()
+            factory.return_value.__aenter__.return_value = db
+            updated = await tracker.flush()
+
+        assert updated == 1
+        statement = db.execute.await_args[0][0]
+        bound_values = list(statement.compile().params.values())
+        assert newer in bound_values
+        assert older not in bound_values
+
+    @pytest.mark.asyncio
+    async def test_flush_respects_max_batch_size(self):
+        """Each flush drains at most max_batch_size items; the rest wait"""
+        tracker = ProfileActivityTracker(max_batch_size=2)
+        tracker.touch("p1")
+        tracker.touch("p2")
+        tracker.touch("p3")
+
+        with patch('app.services.profile_activity.AsyncSessionLocal') as factory:
+            db = AsyncMock()
+            factory.return_value.__aenter__.return_value = db
+            updated = await tracker.flush()
+
+        assert updated == 2
+        assert tracker._queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_without_views_skips_view_counts(self):
+        """Touch-only flushes update last_active but not profile_views"""
+        tracker = ProfileActivityTracker()
+        tracker.touch("p1")
+
+        with patch('app.services.profile_activity.AsyncSessionLocal') as factory:
+            db = AsyncMock()
+            factory.return_value.__aenter__.return_value = db
+            updated = await tracker.flush()
+
+        assert updated == 1
+        statement = db.execute.await_args[0][0]
+        compiled = str(statement.compile())
+        assert "last_active" in compiled
+        assert "profile_views" not in compiled
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])